@@ -14,20 +14,23 @@ class TTLCache:
     def __init__(self, ttl: float, max_size: int = 5000):
         self._ttl = ttl
         self._max_size = max_size
-        self._data: dict[str, tuple[float, Any]] = {}
+        self._data: dict[str, tuple[float, float, Any]] = {}  # key -> (ts, ttl, value)
 
     def get(self, key: str) -> Any | None:
         """Get a cached value, or None if missing/expired."""
         if key in self._data:
-            ts, result = self._data[key]
-            if time.time() - ts < self._ttl:
+            ts, ttl, result = self._data[key]
+            if time.time() - ts < ttl:
                 return result
             del self._data[key]
         return None
 
-    def set(self, key: str, value: Any) -> None:
-        """Cache a value. Evicts expired entries first, then oldest if still over max_size."""
-        self._data[key] = (time.time(), value)
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Cache a value, optionally with its own TTL (defaults to the cache TTL).
+
+        Evicts expired entries first, then oldest if still over max_size.
+        """
+        self._data[key] = (time.time(), self._ttl if ttl is None else ttl, value)
         if len(self._data) > self._max_size:
             self._evict()
 
@@ -35,7 +38,7 @@ class TTLCache:
         """Remove expired entries, then oldest entries if still over max_size."""
         now = time.time()
         # First pass: remove expired
-        expired = [k for k, (ts, _) in self._data.items() if now - ts >= self._ttl]
+        expired = [k for k, (ts, ttl, _) in self._data.items() if now - ts >= ttl]
         for k in expired:
             del self._data[k]
         # Second pass: LRU eviction if still over limit
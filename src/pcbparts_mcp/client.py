@@ -1,6 +1,7 @@
 """JLCPCB API client for searching electronic components."""
 
 import asyncio
+import functools
 import heapq
 import logging
 import re
@@ -98,6 +99,38 @@ _MANUFACTURER_EXACT_NORMALIZED: dict[str, str] = {
     _normalize_manufacturer_name(name): name for name in KNOWN_MANUFACTURERS
 }
 
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_manufacturer_name(name: str) -> str:
+    """Resolve manufacturer alias to full name.
+
+    Pure function of the static alias tables, so memoized: every search
+    with a manufacturer filter resolves the same handful of names.
+
+    Lookup order:
+    1. Check aliases exactly (case-insensitive)
+    2. Check exact manufacturer names (case-insensitive)
+    3. Check aliases with normalized punctuation
+    4. Check manufacturer names with normalized punctuation
+    5. Return original name unchanged
+    """
+    name_lower = name.lower()
+    # Check aliases first (abbreviations and alternate names)
+    if name_lower in MANUFACTURER_ALIASES:
+        return MANUFACTURER_ALIASES[name_lower]
+    # Check if it matches a known manufacturer name (case-insensitive)
+    if name_lower in _MANUFACTURER_EXACT_NAMES:
+        return _MANUFACTURER_EXACT_NAMES[name_lower]
+    # Try normalized matching (ignore punctuation like . , - & etc)
+    name_normalized = _normalize_manufacturer_name(name)
+    if name_normalized in _MANUFACTURER_ALIASES_NORMALIZED:
+        return _MANUFACTURER_ALIASES_NORMALIZED[name_normalized]
+    if name_normalized in _MANUFACTURER_EXACT_NORMALIZED:
+        return _MANUFACTURER_EXACT_NORMALIZED[name_normalized]
+    # Return original unchanged
+    return name
+
+
 class JLCPCBClient:
     """Async client for JLCPCB component search API with anti-detection via wafer."""
 
@@ -108,6 +141,7 @@ class JLCPCBClient:
         self._categories: list[dict[str, Any]] = []
         self._category_map: dict[int, dict[str, Any]] = {}  # id -> category
         self._category_name_map: dict[str, int] = {}  # lowercase name -> category_id (O(1) lookup)
+        self._abbreviation_map: dict[str, int] = {}  # abbreviation -> category_id (O(1) lookup)
         self._subcategory_map: dict[int, tuple[int, dict[str, Any]]] = {}  # id -> (parent_id, subcategory)
         self._subcategory_name_map: dict[str, int] = {}  # name -> subcategory_id
         # EasyEDA footprint cache: lcsc -> (timestamp, result_dict, is_error)
@@ -161,6 +195,21 @@ class JLCPCBClient:
                 self._subcategory_map[sub["id"]] = (cat["id"], sub)
                 # Store lowercase for case-insensitive matching
                 self._subcategory_name_map[sub["name"].lower()] = sub["id"]
+        self._build_abbreviation_map()
+
+    def _build_abbreviation_map(self) -> None:
+        """Resolve _ABBREVIATION_TO_CATEGORY against the loaded categories once.
+
+        Uses the first category whose name contains the target (case-insensitive),
+        so match_category_by_name never has to scan categories for abbreviations.
+        """
+        self._abbreviation_map.clear()
+        for abbrev, category_name in self._ABBREVIATION_TO_CATEGORY.items():
+            category_name_lower = category_name.lower()
+            for cat in self._categories:
+                if category_name_lower in cat["name"].lower():
+                    self._abbreviation_map[abbrev] = cat["id"]
+                    break
 
     def _build_category_name_mappings(self, cat: dict[str, Any]) -> None:
         """Build O(1) name lookup mappings for a category.
@@ -229,16 +278,7 @@ class JLCPCBClient:
         if self._categories:
             return
 
-        self._categories = await self.fetch_categories()
-
-        # Build lookup maps
-        for cat in self._categories:
-            self._category_map[cat["id"]] = cat
-            self._build_category_name_mappings(cat)
-            for sub in cat.get("subcategories", []):
-                self._subcategory_map[sub["id"]] = (cat["id"], sub)
-                # Store lowercase for case-insensitive matching
-                self._subcategory_name_map[sub["name"].lower()] = sub["id"]
+        self.set_categories(await self.fetch_categories())
 
     def _get_category(self, category_id: int) -> dict[str, Any] | None:
         """Get category by ID from cache."""
@@ -279,47 +319,16 @@ class JLCPCBClient:
     }
 
     def _resolve_manufacturer(self, name: str) -> str:
-        """Resolve manufacturer alias to full name.
-
-        Lookup order:
-        1. Check aliases exactly (case-insensitive)
-        2. Check exact manufacturer names (case-insensitive)
-        3. Check aliases with normalized punctuation
-        4. Check manufacturer names with normalized punctuation
-        5. Return original name unchanged
-        """
-        name_lower = name.lower()
-        # Check aliases first (abbreviations and alternate names)
-        if name_lower in MANUFACTURER_ALIASES:
-            return MANUFACTURER_ALIASES[name_lower]
-        # Check if it matches a known manufacturer name (case-insensitive)
-        if name_lower in _MANUFACTURER_EXACT_NAMES:
-            return _MANUFACTURER_EXACT_NAMES[name_lower]
-        # Try normalized matching (ignore punctuation like . , - & etc)
-        name_normalized = _normalize_manufacturer_name(name)
-        if name_normalized in _MANUFACTURER_ALIASES_NORMALIZED:
-            return _MANUFACTURER_ALIASES_NORMALIZED[name_normalized]
-        if name_normalized in _MANUFACTURER_EXACT_NORMALIZED:
-            return _MANUFACTURER_EXACT_NORMALIZED[name_normalized]
-        # Return original unchanged
-        return name
+        """Resolve manufacturer alias to full name (see _resolve_manufacturer_name)."""
+        return _resolve_manufacturer_name(name)
 
     def _resolve_manufacturers(self, names: list[str]) -> list[str]:
         """Resolve a list of manufacturer names/aliases."""
         return [self._resolve_manufacturer(name) for name in names]
 
     def _resolve_abbreviation(self, abbrev: str) -> int | None:
-        """Resolve an abbreviation to a category ID using the live category cache."""
-        category_name = self._ABBREVIATION_TO_CATEGORY.get(abbrev)
-        if not category_name:
-            return None
-
-        # Find category by name (case-insensitive, partial match)
-        category_name_lower = category_name.lower()
-        for cat in self._categories:
-            if category_name_lower in cat["name"].lower():
-                return cat["id"]
-        return None
+        """Resolve an abbreviation to a category ID (precomputed in set_categories)."""
+        return self._abbreviation_map.get(abbrev)
 
     def match_category_by_name(self, query: str) -> int | None:
         """Match a query string against category names.
@@ -339,7 +348,7 @@ class JLCPCBClient:
         if query_lower in self._category_name_map:
             return self._category_name_map[query_lower]
 
-        # Check explicit abbreviation mappings (resolved dynamically)
+        # O(1) lookup for explicit abbreviation mappings
         abbrev_match = self._resolve_abbreviation(query_lower)
         if abbrev_match is not None:
             return abbrev_match
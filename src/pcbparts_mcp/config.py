@@ -51,6 +51,12 @@ DIGIKEY_CLIENT_SECRET = os.getenv("DIGIKEY_CLIENT_SECRET", "")
 DIGIKEY_BASE_URL = "https://api.digikey.com/products/v4"
 DIGIKEY_TOKEN_URL = "https://api.digikey.com/v1/oauth2/token"
 DIGIKEY_CACHE_TTL = 3600
+DIGIKEY_NOT_FOUND_CACHE_TTL = 300  # Cache "part not found" for 5 minutes so retries don't re-hit the API
+DIGIKEY_ETAG_CACHE_TTL = 60 * 60 * 24  # Keep ETags for 24 hours to revalidate expired parts with a 304
+DIGIKEY_STABLE_CACHE_TTL = 60 * 60 * 24  # Stable part details (no stock/price) kept 24 hours as a quota fallback
+DIGIKEY_TOKEN_REFRESH_MARGIN = 120  # Background refresh runs this many seconds before the token expires
+DIGIKEY_TOKEN_RETRY_DELAY = 30  # Minimum wait between background refresh attempts
+DIGIKEY_CONCURRENT_LIMIT = 5  # Max concurrent requests to DigiKey API (sized for the connection pool)
 DIGIKEY_LOCALE_SITE = os.getenv("DIGIKEY_LOCALE_SITE", "US")
 DIGIKEY_LOCALE_LANGUAGE = os.getenv("DIGIKEY_LOCALE_LANGUAGE", "en")
 DIGIKEY_LOCALE_CURRENCY = os.getenv("DIGIKEY_LOCALE_CURRENCY", "USD")
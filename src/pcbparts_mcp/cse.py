@@ -148,15 +148,16 @@ class CSEClient:
 
         raw_parts = data.get("parts", [])
 
-        # Deduplicate by MPN+manufacturer
-        parts = []
+        # Deduplicate by MPN+manufacturer (first occurrence wins) and normalize
+        # in the same pass, so duplicates are never normalized
         seen: set[tuple[str, str]] = set()
+        parts = []
         for raw in raw_parts:
-            normalized = _normalize_part(raw)
-            key = (normalized["mfr_part_number"], normalized["manufacturer"])
-            if key not in seen:
-                seen.add(key)
-                parts.append(normalized)
+            key = (raw.get("PartNo", ""), raw.get("Manuf", ""))
+            if key in seen:
+                continue
+            seen.add(key)
+            parts.append(_normalize_part(raw))
 
         # partCount is unreliable (often 0), so use len(parts) as fallback
         total = data.get("partCount", 0)
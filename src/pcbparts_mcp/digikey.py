@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
+from collections.abc import Sequence
 from typing import Any, TYPE_CHECKING
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 import httpx
+import orjson
 
 from .cache import TTLCache
 from .config import (
@@ -17,6 +20,12 @@ from .config import (
     DIGIKEY_BASE_URL,
     DIGIKEY_TOKEN_URL,
     DIGIKEY_CACHE_TTL,
+    DIGIKEY_NOT_FOUND_CACHE_TTL,
+    DIGIKEY_CONCURRENT_LIMIT,
+    DIGIKEY_ETAG_CACHE_TTL,
+    DIGIKEY_STABLE_CACHE_TTL,
+    DIGIKEY_TOKEN_REFRESH_MARGIN,
+    DIGIKEY_TOKEN_RETRY_DELAY,
     DIGIKEY_LOCALE_SITE,
     DIGIKEY_LOCALE_LANGUAGE,
     DIGIKEY_LOCALE_CURRENCY,
@@ -27,6 +36,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Characters quote() leaves untouched; MPNs made only of these skip encoding
+_SAFE_MPN = re.compile(r'[A-Za-z0-9_.~-]+')
+
+_TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Normalized fields that move day to day; everything else is stable part metadata
+_VOLATILE_FIELDS = frozenset({"stock", "price", "price_breaks", "lifecycle"})
+
 
 def _normalize_product(product: dict[str, Any]) -> dict[str, Any]:
     """Normalize a DigiKey Product object into our standard format."""
@@ -36,36 +53,34 @@ def _normalize_product(product: dict[str, Any]) -> dict[str, Any]:
     status = product.get("ProductStatus", {})
     classifications = product.get("Classifications", {})
 
-    # Get best pricing from first variation
-    price_breaks = []
-    variations = product.get("ProductVariations", [])
-    stock = product.get("QuantityAvailable", 0)
+    # Get best pricing and DigiKey part number from first variation
+    variations = product.get("ProductVariations") or ()
+    stock = product.get("QuantityAvailable")
+    if stock is None:
+        stock = 0
     min_qty = 1
+    price_breaks = []
+    digikey_pn = ""
 
     if variations:
-        # Use first variation for pricing
         first_var = variations[0]
-        min_qty = first_var.get("MinimumOrderQuantity", 1) or 1
-        for sp in first_var.get("StandardPricing", []):
-            price_breaks.append({
-                "qty": sp.get("BreakQuantity", 0),
-                "price": sp.get("UnitPrice", 0),
-            })
+        min_qty = first_var.get("MinimumOrderQuantity")
+        if min_qty is None:
+            min_qty = 1
+        price_breaks = [
+            {"qty": sp.get("BreakQuantity", 0), "price": sp.get("UnitPrice", 0)}
+            for sp in first_var.get("StandardPricing", ())
+        ]
+        digikey_pn = first_var.get("DigiKeyProductNumber", "")
 
     unit_price = product.get("UnitPrice") or (price_breaks[0]["price"] if price_breaks else None)
 
-    # Get DigiKey part number from first variation
-    digikey_pn = ""
-    if variations:
-        digikey_pn = variations[0].get("DigiKeyProductNumber", "")
-
     # Parse parameters
-    parameters = {}
-    for param in product.get("Parameters", []):
-        name = param.get("ParameterText")
-        value = param.get("ValueText")
-        if name and value:
-            parameters[name] = value
+    parameters = {
+        p["ParameterText"]: p["ValueText"]
+        for p in product.get("Parameters", ())
+        if p.get("ParameterText") and p.get("ValueText")
+    }
 
     # Determine lifecycle
     lifecycle = status.get("Status", "Unknown")
@@ -79,7 +94,7 @@ def _normalize_product(product: dict[str, Any]) -> dict[str, Any]:
         "manufacturer": manufacturer.get("Name", ""),
         "description": desc.get("ProductDescription", ""),
         "category": category.get("Name", ""),
-        "stock": stock or 0,
+        "stock": stock,
         "price": unit_price,
         "price_breaks": price_breaks,
         "datasheet_url": product.get("DatasheetUrl"),
@@ -101,47 +116,104 @@ class DigiKeyClient:
         client_secret: str = DIGIKEY_CLIENT_SECRET,
         quota: DailyQuota | None = None,
     ):
-        self._client_id = client_id
-        self._client_secret = client_secret
         self._http: httpx.AsyncClient | None = None
         # OAuth2 token state
         self._access_token: str | None = None
         self._token_expires_at: float = 0
         self._token_lock: asyncio.Lock | None = None
+        # Background task that refreshes the token ahead of expiry
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._semaphore: asyncio.BoundedSemaphore | None = None
+        # Lookups in flight by cache key, so concurrent callers share one request
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        # Request headers: everything but Authorization is fixed per client,
+        # and the bearer string is rebuilt only when the token rotates
+        self._static_headers = {
+            "X-DIGIKEY-Client-Id": client_id,
+            "X-DIGIKEY-Locale-Site": DIGIKEY_LOCALE_SITE,
+            "X-DIGIKEY-Locale-Language": DIGIKEY_LOCALE_LANGUAGE,
+            "X-DIGIKEY-Locale-Currency": DIGIKEY_LOCALE_CURRENCY,
+            "Content-Type": "application/json",
+        }
+        self._bearer_token: str | None = None
+        self._bearer_header = ""
+        # Credentials never change, so the token request body is encoded once
+        self._token_body = urlencode({
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "client_credentials",
+        }).encode()
         self._cache = TTLCache(ttl=DIGIKEY_CACHE_TTL)
+        # (etag, result) kept past the main TTL for conditional revalidation
+        self._etag_cache = TTLCache(ttl=DIGIKEY_ETAG_CACHE_TTL)
+        # Stable fields (mfr PN, datasheet, parameters...) outlive stock/price
+        self._stable_cache = TTLCache(ttl=DIGIKEY_STABLE_CACHE_TTL)
         self._quota = quota
 
     def _get_http(self) -> httpx.AsyncClient:
         if self._http is None:
-            self._http = httpx.AsyncClient(timeout=15.0)
+            # All traffic goes to one host: keep a small warm pool and let
+            # HTTP/2 multiplex concurrent requests over it
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(15.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=DIGIKEY_CONCURRENT_LIMIT,
+                    max_connections=DIGIKEY_CONCURRENT_LIMIT * 2,
+                    keepalive_expiry=60.0,
+                ),
+                http2=True,
+            )
         return self._http
 
+    def _get_semaphore(self) -> asyncio.BoundedSemaphore:
+        # Safe in single-threaded asyncio: no await between None check and assignment
+        if self._semaphore is None:
+            self._semaphore = asyncio.BoundedSemaphore(DIGIKEY_CONCURRENT_LIMIT)
+        return self._semaphore
+
     def _get_token_lock(self) -> asyncio.Lock:
         # Safe in single-threaded asyncio: no await between None check and assignment
         if self._token_lock is None:
             self._token_lock = asyncio.Lock()
         return self._token_lock
 
-    async def _ensure_token(self) -> str:
-        """Get a valid OAuth2 token, refreshing if needed."""
+    async def _ensure_token(self, invalidate: str | None = None, force: bool = False) -> str:
+        """Get a valid OAuth2 token, refreshing if needed.
+
+        Args:
+            invalidate: Token the caller just had rejected (HTTP 401). It is only
+                discarded if still current, so N concurrent 401s on the same
+                token trigger one refresh, and a token another coroutine already
+                refreshed is never thrown away.
+            force: Refresh a token that is still valid but inside the refresh
+                margin (background refresh). The current token stays in use
+                until the new one arrives, and is kept if the refresh fails.
+        """
         # Fast path: token is still valid (with 100s safety margin)
-        if self._access_token and time.time() < self._token_expires_at - 100:
+        if (
+            not force
+            and self._access_token
+            and self._access_token != invalidate
+            and time.time() < self._token_expires_at - 100
+        ):
             return self._access_token
 
         async with self._get_token_lock():
-            # Double-check after acquiring lock
-            if self._access_token and time.time() < self._token_expires_at - 100:
+            # Compare-and-swap: drop the rejected token only if nobody replaced it
+            if invalidate is not None and self._access_token == invalidate:
+                self._access_token = None
+
+            # Double-check after acquiring lock (a forced refresh is only skipped
+            # if another coroutine already refreshed past the refresh margin)
+            margin = DIGIKEY_TOKEN_REFRESH_MARGIN if force else 100
+            if self._access_token and time.time() < self._token_expires_at - margin:
                 return self._access_token
 
             try:
                 response = await self._get_http().post(
                     DIGIKEY_TOKEN_URL,
-                    data={
-                        "client_id": self._client_id,
-                        "client_secret": self._client_secret,
-                        "grant_type": "client_credentials",
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    content=self._token_body,
+                    headers=_TOKEN_HEADERS,
                 )
             except httpx.HTTPError:
                 raise ValueError("DigiKey token request failed (network/connection error)")
@@ -158,41 +230,75 @@ class DigiKeyClient:
             expires_in = data.get("expires_in", 599)
             self._token_expires_at = time.time() + expires_in
 
+            # Safe in single-threaded asyncio: no await between check and assignment
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_loop())
+
             logger.debug(f"DigiKey token refreshed, expires in {expires_in}s")
             return self._access_token
 
     def _auth_headers(self, token: str) -> dict[str, str]:
         """Build required headers for DigiKey API requests."""
-        return {
-            "Authorization": f"Bearer {token}",
-            "X-DIGIKEY-Client-Id": self._client_id,
-            "X-DIGIKEY-Locale-Site": DIGIKEY_LOCALE_SITE,
-            "X-DIGIKEY-Locale-Language": DIGIKEY_LOCALE_LANGUAGE,
-            "X-DIGIKEY-Locale-Currency": DIGIKEY_LOCALE_CURRENCY,
-            "Content-Type": "application/json",
-        }
+        if token != self._bearer_token:
+            self._bearer_token = token
+            self._bearer_header = f"Bearer {token}"
+        return {"Authorization": self._bearer_header, **self._static_headers}
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the token shortly before it expires so requests never wait on it."""
+        while True:
+            delay = self._token_expires_at - DIGIKEY_TOKEN_REFRESH_MARGIN - time.time()
+            await asyncio.sleep(max(delay, DIGIKEY_TOKEN_RETRY_DELAY))
+            if time.time() < self._token_expires_at - DIGIKEY_TOKEN_REFRESH_MARGIN:
+                continue  # Already refreshed meanwhile (e.g. after a 401)
+            try:
+                await self._ensure_token(force=True)
+            except ValueError as e:
+                # The current token stays in use (a 401 still triggers the
+                # synchronous refresh); retry after the delay
+                logger.warning("DigiKey background token refresh failed: %s", e)
 
-    async def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
-        """Make an authenticated request to DigiKey API."""
-        token = await self._ensure_token()
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        extra_headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Make an authenticated request to DigiKey API and return the raw response.
+
+        Raises ValueError on network errors and HTTP >= 400 (304 is returned as-is).
+        """
+        # While the background refresh runs, the current token is used as-is;
+        # a 401 (expiry, clock skew) still falls back to a synchronous refresh.
+        # If the task has stopped, the normal expiry check applies (and restarts it)
+        token = self._access_token
+        if token is None or self._refresh_task is None or self._refresh_task.done():
+            token = await self._ensure_token()
         headers = self._auth_headers(token)
+        if extra_headers:
+            headers.update(extra_headers)
         url = f"{DIGIKEY_BASE_URL}{path}"
 
         try:
-            response = await self._get_http().request(method, url, headers=headers, **kwargs)
-
-            # Handle token expiration mid-flight
-            if response.status_code == 401:
-                self._access_token = None
-                token = await self._ensure_token()
-                headers = self._auth_headers(token)
+            # One slot covers the retry too, so a 401 retry is not re-queued
+            # behind fresh work
+            async with self._get_semaphore():
                 response = await self._get_http().request(method, url, headers=headers, **kwargs)
+
+                # Handle token expiration mid-flight
+                if response.status_code == 401:
+                    token = await self._ensure_token(invalidate=token)
+                    headers = self._auth_headers(token)
+                    if extra_headers:
+                        headers.update(extra_headers)
+                    response = await self._get_http().request(method, url, headers=headers, **kwargs)
         except httpx.HTTPError:
             raise ValueError("DigiKey API request failed (network/connection error)")
 
         if response.status_code >= 400:
             raise ValueError(f"DigiKey API returned HTTP {response.status_code}")
-        return response.json()
+        return response
 
     async def get_part(self, product_number: str) -> dict[str, Any]:
         """Look up a part by DigiKey PN or manufacturer PN.
@@ -203,34 +309,141 @@ class DigiKeyClient:
         Returns:
             Dict with results list and total (consistent with Mouser format)
         """
-        cache_key = f"digikey:{product_number.strip()}"
+        # Part numbers are case-insensitive, so cosmetic variants share one entry
+        cache_key = f"digikey:{product_number.strip().upper()}"
         cached = self._cache.get(cache_key)
         if cached is not None:
             return cached
 
+        # Coalesce: concurrent lookups of the same part share one fetch task.
+        # Every caller (the first included) awaits it shielded, so a cancelled
+        # caller never cancels the lookup the others are waiting on
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_part(product_number, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_part(self, product_number: str, cache_key: str) -> dict[str, Any]:
+        """Fetch one part from the API (cache miss path of get_part)."""
         # Check daily quota (after cache so cache hits don't count)
         if self._quota:
             quota_error = self._quota.check()
             if quota_error:
+                # Out of quota: still answer from stable part details if we have them
+                stable = self._stable_cache.get(cache_key)
+                if stable is not None:
+                    return {
+                        "results": [stable],
+                        "total": 1,
+                        "note": "DigiKey daily quota exceeded; showing cached part details without stock or pricing.",
+                    }
                 return quota_error
 
+        # Revalidate an expired entry with If-None-Match: an unchanged part comes
+        # back as an empty 304 instead of the full product payload
+        stale = self._etag_cache.get(cache_key)
+        extra_headers = {"If-None-Match": stale[0]} if stale else None
+
         # URL-encode to prevent path traversal or special chars altering the URL
-        safe_pn = quote(product_number, safe='')
-        data = await self._request("GET", f"/search/{safe_pn}/productdetails")
+        if _SAFE_MPN.fullmatch(product_number):
+            safe_pn = product_number
+        else:
+            safe_pn = quote(product_number, safe='')
+        response = await self._send(
+            "GET", f"/search/{safe_pn}/productdetails", extra_headers=extra_headers
+        )
+        if response.status_code == 304 and stale:
+            result = stale[1]
+            self._cache.set(cache_key, result)
+            # Restart the ETag's TTL too, so a part revalidated regularly keeps
+            # being served from 304s instead of a full re-download
+            self._etag_cache.set(cache_key, stale)
+            return result
+
+        # orjson decodes the nested product payload several times faster than stdlib json
+        data = orjson.loads(response.content)
         product = data.get("Product", {})
 
         if not product:
-            return {"error": f"Part not found: {product_number}"}
+            # Negative-cache misses (shorter TTL) so repeated lookups of a dead MPN
+            # don't cost an API call and a quota unit every time
+            result = {"error": f"Part not found: {product_number}"}
+            self._cache.set(cache_key, result, ttl=DIGIKEY_NOT_FOUND_CACHE_TTL)
+            return result
 
+        part = _normalize_product(product)
         result = {
-            "results": [_normalize_product(product)],
+            "results": [part],
             "total": 1,
         }
         self._cache.set(cache_key, result)
+        self._stable_cache.set(
+            cache_key, {k: v for k, v in part.items() if k not in _VOLATILE_FIELDS}
+        )
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(cache_key, (etag, result))
         return result
 
+    async def get_part_any(self, variants: Sequence[str]) -> dict[str, Any]:
+        """Look up the first of several spellings of one part (e.g. from normalize_mpn).
+
+        The first variant (the original query) is tried alone, so the common hit
+        costs one request. On a miss, the remaining variants are looked up
+        concurrently and the first hit in variant order wins.
+
+        Args:
+            variants: Part number variants in order of preference (original first)
+
+        Returns:
+            get_part() result for the first variant found, with an "mpn_normalized"
+            note when it was not the original, else the original's error result.
+
+        Raises:
+            ValueError: The original's lookup failed (e.g. HTTP 4xx) and no
+                variant was found either.
+        """
+        first: dict[str, Any] = {}
+        first_error: Exception | None = None
+        try:
+            first = await self.get_part(variants[0])
+        except Exception as e:
+            # Like the remaining variants' failures, only surfaced if no
+            # normalized variant is found
+            first_error = e
+        if "results" in first:
+            return first
+
+        if len(variants) > 1 and not (self._quota and not self._quota.remaining):
+            retries = await asyncio.gather(
+                *(self.get_part(v) for v in variants[1:]), return_exceptions=True
+            )
+            for variant, result in zip(variants[1:], retries):
+                if isinstance(result, dict) and "results" in result:
+                    return {
+                        **result,
+                        "mpn_normalized": {
+                            "original_query": variants[0],
+                            "matched_query": variant,
+                            "note": "Original query had no results; found matches using normalized MPN variant",
+                        },
+                    }
+
+        if first_error is not None:
+            raise first_error
+        return first
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop the token refresh task and close the HTTP client."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
         if self._http:
             await self._http.aclose()
             self._http = None
@@ -59,24 +59,24 @@ def parse_easyeda_pins(data: dict[str, Any]) -> list[dict[str, Any]]:
             continue
 
         # Extract electrical type (index 2) and pin number (index 3)
-        # Format: P~show~{electric}~{pin_num}~...
-        parts = element.split("~")
+        # Format: P~show~{electric}~{pin_num}~... (only split off what we read)
+        parts = element.split("~", 4)
         electric_code = parts[2] if len(parts) > 2 else ""
         pin_num = parts[3] if len(parts) > 3 else None
 
-        # Extract labels from both positions
+        # Name is whichever label is NOT just a number. Check the start label
+        # first; the end label is only searched when it can still decide.
         start_match = _START_LABEL_PATTERN.search(element)
-        end_match = _END_LABEL_PATTERN.search(element)
         start_label = start_match.group(1) if start_match else None
-        end_label = end_match.group(1) if end_match else None
-
-        # Name is whichever label is NOT just a number
         if start_label and not start_label.isdigit():
             pin_name = start_label
-        elif end_label and not end_label.isdigit():
-            pin_name = end_label
         else:
-            pin_name = pin_num  # Use pin number as name
+            end_match = _END_LABEL_PATTERN.search(element)
+            end_label = end_match.group(1) if end_match else None
+            if end_label and not end_label.isdigit():
+                pin_name = end_label
+            else:
+                pin_name = pin_num  # Use pin number as name
 
         pin_data = {
             "number": pin_num,
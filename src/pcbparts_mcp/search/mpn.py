@@ -5,7 +5,9 @@ returns no results. It's separate from query resolvers because MPN normalization
 is a fallback behavior, not input transformation.
 """
 
+import functools
 import re
+import string
 
 
 # =============================================================================
@@ -30,6 +32,11 @@ MPN_TRAILING_SUFFIXES = [
     "+TR",      # Tape & Reel (some manufacturers)
 ]
 
+# Tuple form for str.endswith(). No suffix above ends with another one, so at
+# most one can match a query and their order doesn't matter (keep it that way
+# when adding suffixes). Used to strip at most one suffix per query.
+_MPN_SUFFIXES = tuple(MPN_TRAILING_SUFFIXES)
+
 # Pattern to detect part numbers where "T" is inserted before the variant suffix
 # e.g., MCP73831-2ACI/MC -> MCP73831T-2ACI/MC (Microchip tape & reel convention)
 # Pattern: letters + numbers + optional letter + "-" + variant
@@ -39,10 +46,29 @@ _MPN_INSERT_T_PATTERN = re.compile(
 )
 
 
-def normalize_mpn(query: str) -> list[str]:
+def _insert_t(mpn: str) -> str | None:
+    """Return the tape & reel "T" variant of an uppercase MPN, or None if not applicable.
+
+    MCP73831-2ACI/MC -> MCP73831T-2ACI/MC. Bases already ending in T are left alone.
+    """
+    # The pattern requires a dash, so skip the regex for dashless MPNs
+    if '-' not in mpn:
+        return None
+    match = _MPN_INSERT_T_PATTERN.match(mpn)
+    if match is None:
+        return None
+    base, suffix = match.groups()
+    if base.endswith('T'):
+        return None
+    return f"{base}T{suffix}"
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_mpn(query: str) -> tuple[str, ...]:
     """Generate normalized variants of an MPN query for better matching.
 
-    Returns a list of query variants to try, in order of preference:
+    Returns a tuple of query variants to try, in order of preference
+    (memoized: BOMs and retried searches repeat the same MPNs):
     1. Original query (always first)
     2. With trailing suffixes stripped
     3. With "T" inserted (for tape & reel variants)
@@ -51,50 +77,43 @@ def normalize_mpn(query: str) -> list[str]:
     uppercase for generated variants).
 
     Examples:
-        "MCP73831-2ACI/MC" -> ["MCP73831-2ACI/MC", "MCP73831T-2ACI/MC"]
-        "STM32F103C8T6-TR" -> ["STM32F103C8T6-TR", "STM32F103C8T6"]
-        "LM1117-3.3" -> ["LM1117-3.3"] (no changes needed)
+        "MCP73831-2ACI/MC" -> ("MCP73831-2ACI/MC", "MCP73831T-2ACI/MC")
+        "STM32F103C8T6-TR" -> ("STM32F103C8T6-TR", "STM32F103C8T6")
+        "LM1117-3.3" -> ("LM1117-3.3",) (no changes needed)
     """
-    variants = [query]  # Original always first
-    seen_upper: set[str] = {query.upper()}  # Track seen variants case-insensitively
     working = query.upper()
+    # Uppercase key -> variant, so insertion order is preference order and
+    # duplicates are dropped case-insensitively. Generated variants are derived
+    # from `working`, so they are already uppercase and serve as their own key.
+    variants: dict[str, str] = {working: query}  # Original always first
 
-    # Strip trailing suffixes
+    # Strip one trailing suffix (single endswith() gate for the common no-suffix case)
     stripped = working
-    for suffix in MPN_TRAILING_SUFFIXES:
-        if stripped.endswith(suffix):
-            stripped = stripped[:-len(suffix)]
-            break  # Only strip one suffix
+    if working.endswith(_MPN_SUFFIXES):
+        for suffix in _MPN_SUFFIXES:
+            if working.endswith(suffix):
+                stripped = working[:-len(suffix)]
+                break
+    variants.setdefault(stripped, stripped)
+
+    # Try inserting "T" for tape & reel variant (Microchip convention), on the
+    # original and, if a suffix was stripped, on the stripped version too
+    # MCP73831-2ACI/MC -> MCP73831T-2ACI/MC
+    candidates = [working] if stripped == working else [working, stripped]
+    for candidate in candidates:
+        with_t = _insert_t(candidate)
+        if with_t is not None:
+            variants.setdefault(with_t, with_t)
 
-    if stripped.upper() not in seen_upper:
-        variants.append(stripped)
-        seen_upper.add(stripped.upper())
+    return tuple(variants.values())
 
-    # Try inserting "T" for tape & reel variant (Microchip convention)
-    # MCP73831-2ACI/MC -> MCP73831T-2ACI/MC
-    match = _MPN_INSERT_T_PATTERN.match(working)
-    if match:
-        base = match.group(1)
-        suffix = match.group(2)
-        # Only if base doesn't already end with T
-        if not base.endswith('T'):
-            with_t = f"{base}T{suffix}"
-            if with_t.upper() not in seen_upper:
-                variants.append(with_t)
-                seen_upper.add(with_t.upper())
-
-    # Also try with stripped version + T insertion
-    match = _MPN_INSERT_T_PATTERN.match(stripped)
-    if match:
-        base = match.group(1)
-        suffix = match.group(2)
-        if not base.endswith('T'):
-            with_t = f"{base}T{suffix}"
-            if with_t.upper() not in seen_upper:
-                variants.append(with_t)
-                seen_upper.add(with_t.upper())
-
-    return variants
+
+# Character classes for the looks_like_mpn letter+digit presence test
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+
+# IC style (STM32, MCP73831) or diode/transistor style (1N4148, 2N2222) prefix
+_MPN_SHAPE_PATTERN = re.compile(r'[A-Z]{1,5}\d{2,}|\d[A-Z]\d{3,}', re.IGNORECASE)
 
 
 def looks_like_mpn(query: str) -> bool:
@@ -108,24 +127,14 @@ def looks_like_mpn(query: str) -> bool:
     if not query or len(query) < 4 or len(query) > 40:
         return False
 
-    # Must have both letters and numbers
-    has_letter = any(c.isalpha() for c in query)
-    has_digit = any(c.isdigit() for c in query)
-
-    if not (has_letter and has_digit):
+    # Must have both letters and numbers (one set build, two C-level checks)
+    chars = set(query)
+    if chars.isdisjoint(_ASCII_LETTERS) or chars.isdisjoint(_DIGITS):
         return False
 
-    # Common MPN patterns
-    # Alphanumeric starting with letters (IC style): STM32, MCP73831, etc.
-    if re.match(r'^[A-Z]{1,5}\d{2,}', query, re.IGNORECASE):
-        return True
-
-    # Digit-starting with letters (diode style): 1N4148, 2N2222, etc.
-    if re.match(r'^\d[A-Z]\d{3,}', query, re.IGNORECASE):
-        return True
-
     # Has a dash or slash separator (common in MPNs)
     if '-' in query or '/' in query:
         return True
 
-    return False
+    # Common MPN prefixes: STM32, MCP73831 (IC style); 1N4148, 2N2222 (diode style)
+    return _MPN_SHAPE_PATTERN.match(query) is not None
@@ -27,7 +27,7 @@ from .digikey import DigiKeyClient
 from .cse import CSEClient
 from .db import get_db, close_db
 from .sensor_db import get_sensor_db, close_sensor_db
-from .search import SpecFilter
+from .search import SpecFilter, normalize_mpn, looks_like_mpn
 from .smart_parser import parse_smart_query, merge_spec_filters
 from .pinout import parse_easyeda_pins
 from .design_rules import get_design_rules as _get_design_rules, _RULES_DIR, _build_index
@@ -864,7 +864,9 @@ async def digikey_get_part(product_number: str) -> dict:
         product_number: DigiKey part number or manufacturer PN (e.g., "296-1395-5-ND" or "LM358P")
 
     Returns:
-        Full product details including all parameters, pricing variations, availability, datasheet
+        Full product details including all parameters, pricing variations, availability, datasheet.
+        If the MPN is not found as given, normalized variants (packaging suffix stripped,
+        tape & reel "T" inserted) are tried and reported under mpn_normalized.
     """
     if not _digikey_client:
         return {"error": "DigiKey API credentials not configured. Set DIGIKEY_CLIENT_ID and DIGIKEY_CLIENT_SECRET in environment."}
@@ -872,6 +874,9 @@ async def digikey_get_part(product_number: str) -> dict:
         return {"error": "Product number too long (max 500 characters)"}
 
     try:
+        # Retry normalized MPN variants (strip -TR, insert T, ...) if the original misses
+        if looks_like_mpn(product_number):
+            return await _digikey_client.get_part_any(normalize_mpn(product_number))
         return await _digikey_client.get_part(product_number)
     except Exception as e:
         logger.error(f"DigiKey part lookup failed: {type(e).__name__}: {e}")
@@ -88,12 +88,25 @@ def extract_connector_series(query: str) -> tuple[ConnectorSpec | None, str]:
 
     # Check brand aliases first (Qwiic, STEMMA QT, easyC)
     for brand, spec in BRAND_CONNECTOR_SPECS.items():
-        if brand in query_lower:
-            # Remove the brand name from query
-            pattern = re.compile(re.escape(brand), re.IGNORECASE)
-            remaining = pattern.sub('', remaining)
-            remaining = re.sub(r'\s+', ' ', remaining).strip()
-            return spec, remaining
+        idx = query_lower.find(brand)
+        if idx >= 0:
+            # Remove every occurrence of the brand name from query
+            if len(query_lower) != len(query):
+                # lower() changed the length (e.g. "İ"), so indices into
+                # query_lower don't line up with query: match case-insensitively
+                pattern = re.compile(re.escape(brand), re.IGNORECASE)
+                remaining = pattern.sub('', remaining)
+            else:
+                # Brands are plain lowercase literals: splice them out by index
+                pieces = []
+                start = 0
+                while idx >= 0:
+                    pieces.append(query[start:idx])
+                    start = idx + len(brand)
+                    idx = query_lower.find(brand, start)
+                pieces.append(query[start:])
+                remaining = ''.join(pieces)
+            return spec, ' '.join(remaining.split())
 
     # Check for explicit JST series pattern (e.g., "jst sh", "jst-ph")
     match = _JST_SERIES_PATTERN.search(query)
@@ -104,7 +117,7 @@ def extract_connector_series(query: str) -> tuple[ConnectorSpec | None, str]:
 
         # Remove the matched pattern from query
         remaining = query[:match.start()] + query[match.end():]
-        remaining = re.sub(r'\s+', ' ', remaining).strip()
+        remaining = ' '.join(remaining.split())
 
         return ConnectorSpec(series=series, pitch=pitch, fts_term=series), remaining
 
@@ -118,7 +131,7 @@ def extract_connector_series(query: str) -> tuple[ConnectorSpec | None, str]:
             # Remove both "jst" and the series code
             remaining = re.sub(r'\bjst\b', '', remaining, flags=re.IGNORECASE)
             remaining = remaining[:series_match.start()] + remaining[series_match.end():]
-            remaining = re.sub(r'\s+', ' ', remaining).strip()
+            remaining = ' '.join(remaining.split())
 
             return ConnectorSpec(series=series, pitch=pitch, fts_term=series), remaining
 
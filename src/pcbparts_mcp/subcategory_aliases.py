@@ -3,11 +3,13 @@
 This module provides:
 - SUBCATEGORY_ALIASES: Maps common shorthand to actual subcategory names
 - resolve_subcategory_name(): Resolves names/aliases to IDs with fuzzy matching
+- build_subcategory_word_index(): Inverted word -> IDs index for suggestions
 
 IMPORTANT: All alias targets must match actual subcategory names in the database.
 Run validation script before committing changes to ensure all mappings are valid.
 """
 
+import re
 from typing import Any
 
 
@@ -565,6 +567,57 @@ def resolve_subcategory_name(
     return matches[0][1]
 
 
+# Word boundaries inside subcategory names ("Translators, Level Shifters",
+# "Multilayer Ceramic Capacitors MLCC - SMD/SMT", "Fuses (Resettable)")
+_SUBCAT_WORD_SPLIT = re.compile(r'[\s,\-/()]+')
+_MIN_WORD_LEN = 3
+
+
+def _split_words(name: str) -> list[str]:
+    """Split a lowercase name into words of at least _MIN_WORD_LEN chars."""
+    return [w for w in _SUBCAT_WORD_SPLIT.split(name) if len(w) >= _MIN_WORD_LEN]
+
+
+def build_subcategory_word_index(
+    name_to_id: dict[str, int],
+) -> dict[str, list[tuple[int, str]]]:
+    """Build an inverted word -> subcategories index for suggestion lookups.
+
+    Plural words are also indexed under their singular form so that
+    "connector" finds "USB Connectors".
+
+    Args:
+        name_to_id: Dict mapping lowercase subcategory names to IDs
+
+    Returns:
+        Dict mapping each word to (subcategory ID, lowercase name) pairs
+        (in name_to_id order).
+    """
+    index: dict[str, list[tuple[int, str]]] = {}
+    for subcat_name_lower, subcat_id in name_to_id.items():
+        words = set(_split_words(subcat_name_lower))
+        words.update([w[:-1] for w in words if w.endswith("s") and len(w) > _MIN_WORD_LEN])
+        for word in words:
+            index.setdefault(word, []).append((subcat_id, subcat_name_lower))
+    return index
+
+
+# (name_to_id, index) for the last name map indexed. Callers pass the same
+# long-lived dict from the loaded caches, so the index is built once.
+_word_index_cache: tuple[dict[str, int], dict[str, list[tuple[int, str]]]] | None = None
+
+
+def _get_word_index(name_to_id: dict[str, int]) -> dict[str, list[tuple[int, str]]]:
+    """Return the word index for name_to_id, rebuilding only for a new name map."""
+    global _word_index_cache
+    cached = _word_index_cache
+    # Identity check: holding the dict in the cache keeps its id from being reused
+    if cached is None or cached[0] is not name_to_id:
+        cached = (name_to_id, build_subcategory_word_index(name_to_id))
+        _word_index_cache = cached
+    return cached[1]
+
+
 def find_similar_subcategories(
     name: str,
     name_to_id: dict[str, int],
@@ -573,6 +626,8 @@ def find_similar_subcategories(
 ) -> list[dict[str, Any]]:
     """Find subcategories similar to the given name (for error suggestions).
 
+    Matches whole words only, so "art" does not match "smart".
+
     Args:
         name: Search query
         name_to_id: Dict mapping lowercase subcategory names to IDs
@@ -582,30 +637,27 @@ def find_similar_subcategories(
     Returns:
         List of similar subcategory dicts with id, name, category.
     """
-    name_lower = name.lower()
-    matches = []
+    # Built on first use (only the not-found error path needs it), then
+    # reused for as long as callers pass the same name_to_id dict
+    word_index = _get_word_index(name_to_id)
 
-    for subcat_name_lower, subcat_id in name_to_id.items():
-        # Check if any word from the query appears in the subcategory name
-        words = name_lower.split()
-        for word in words:
-            if len(word) >= 3 and word in subcat_name_lower:
-                subcat_info = subcategory_info.get(subcat_id, {})
-                matches.append({
-                    "id": subcat_id,
-                    "name": subcat_info.get("name", subcat_name_lower),
-                    "category": subcat_info.get("category_name", ""),
-                })
-                break
-
-    # Dedupe and limit
     seen: set[int] = set()
     unique = []
-    for m in matches:
-        if m["id"] not in seen:
-            seen.add(m["id"])
-            unique.append(m)
+    for word in _split_words(name.lower()):
+        entries = word_index.get(word)
+        if entries is None and word.endswith("s"):
+            entries = word_index.get(word[:-1])
+        for subcat_id, subcat_name_lower in entries or ():
+            if subcat_id in seen:
+                continue
+            seen.add(subcat_id)
+            subcat_info = subcategory_info.get(subcat_id, {})
+            unique.append({
+                "id": subcat_id,
+                "name": subcat_info.get("name", subcat_name_lower),
+                "category": subcat_info.get("category_name", ""),
+            })
             if len(unique) >= limit:
-                break
+                return unique
 
     return unique
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures."""
+
+import pytest_asyncio
+
+from pcbparts_mcp.client import JLCPCBClient
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def live_client():
+    """Live JLCPCB client shared by integration tests for the whole run.
+
+    One client means one wafer session (cookies, connection pool, rate
+    limiting) instead of a fresh TLS handshake per test. Tests using it must
+    run on the session loop: mark them asyncio(loop_scope="session").
+    """
+    client = JLCPCBClient()
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def live_categories(live_client):
+    """Live category tree, fetched once per run and loaded into live_client."""
+    categories = await live_client.fetch_categories()
+    live_client.set_categories(categories)
+    return categories
@@ -1,155 +1,147 @@
 """Tests for JLCPCB API client."""
 
+import asyncio
+import json
+from functools import lru_cache
+from pathlib import Path
+
 import pytest
+import pytest_asyncio
 from pcbparts_mcp.client import JLCPCBClient
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@lru_cache(maxsize=None)
+def load_json_fixture(name: str):
+    """Load a JSON fixture from tests/fixtures (parsed once per session)."""
+    return json.loads((FIXTURES_DIR / name).read_text())
+
+
+# Category cache for unit tests (read-only; set_categories() only indexes it)
+_UNIT_TEST_CATEGORIES = [
+    {
+        "id": 1,
+        "name": "Resistors",
+        "count": 1000000,
+        "subcategories": [
+            {"id": 2980, "name": "Chip Resistor - Surface Mount", "count": 500000},
+        ],
+    },
+    {
+        "id": 5,
+        "name": "Transistors/Thyristors",
+        "count": 110000,
+        "subcategories": [],
+    },
+    {
+        "id": 11,
+        "name": "Circuit Protection",
+        "count": 159000,
+        "subcategories": [],
+    },
+    {
+        "id": 16,
+        "name": "Optoelectronics",
+        "count": 83000,
+        "subcategories": [],
+    },
+    {
+        "id": 29,
+        "name": "Data Acquisition",
+        "count": 25000,
+        "subcategories": [],
+    },
+]
+
+# Minimal single-price-tier API item, shared read-only by the transform edge-case tests
+_MINIMAL_ITEM = {
+    "componentCode": "C12345",
+    "componentModelEn": "TEST",
+    "componentBrandEn": "Test",
+    "componentSpecificationEn": "0402",
+    "stockCount": 100,
+    "componentLibraryType": "base",
+    "preferredComponentFlag": False,
+    "firstSortName": "Test Sub",
+    "secondSortName": "Test Cat",
+    "componentPrices": [{"startNumber": 1, "endNumber": 9, "productPrice": 0.01}],
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Shared unit-test client; tests only read from it, so one per module."""
+    client = JLCPCBClient()
+    client.set_categories(_UNIT_TEST_CATEGORIES)
+    return client
+
 
 class TestClient:
     """Test JLCPCB API client."""
 
-    @pytest.fixture
-    def client(self):
-        client = JLCPCBClient()
-        # Pre-populate category cache for unit tests
-        client.set_categories([
-            {
-                "id": 1,
-                "name": "Resistors",
-                "count": 1000000,
-                "subcategories": [
-                    {"id": 2980, "name": "Chip Resistor - Surface Mount", "count": 500000},
-                ],
-            },
-            {
-                "id": 5,
-                "name": "Transistors/Thyristors",
-                "count": 110000,
-                "subcategories": [],
-            },
-            {
-                "id": 11,
-                "name": "Circuit Protection",
-                "count": 159000,
-                "subcategories": [],
-            },
-            {
-                "id": 16,
-                "name": "Optoelectronics",
-                "count": 83000,
-                "subcategories": [],
-            },
-            {
-                "id": 29,
-                "name": "Data Acquisition",
-                "count": 25000,
-                "subcategories": [],
-            },
-        ])
-        return client
-
-    def test_build_search_params_keyword(self, client):
-        params = client._build_search_params(query="ESP32")
-        assert params["keyword"] == "ESP32"
-        assert params["currentPage"] == 1
-        assert params["pageSize"] == 20
-
-    def test_build_search_params_category(self, client):
-        params = client._build_search_params(category_id=1)
-        assert params["firstSortId"] == 1
-        assert params["firstSortName"] == "Resistors"
-        assert params["searchType"] == 3
-
-    def test_build_search_params_subcategory(self, client):
-        params = client._build_search_params(subcategory_id=2980)
-        assert params["firstSortId"] == 1
-        assert params["firstSortName"] == "Resistors"
-        assert params["secondSortId"] == 2980
-        assert params["secondSortName"] == "Chip Resistor - Surface Mount"
-        assert params["searchType"] == 3
-
-    def test_build_search_params_stock(self, client):
-        params = client._build_search_params(min_stock=1000)
-        assert params["startStockNumber"] == 1000
-
-    def test_build_search_params_library_type_basic(self, client):
-        params = client._build_search_params(library_type="basic")
-        assert params["componentLibraryType"] == "base"
-
-    def test_build_search_params_library_type_extended(self, client):
-        params = client._build_search_params(library_type="extended")
-        assert params["componentLibraryType"] == "expand"
-
-    def test_build_search_params_library_type_preferred(self, client):
-        params = client._build_search_params(library_type="preferred")
-        assert params["preferredComponentFlag"] is True
-
-    def test_build_search_params_library_type_no_fee(self, client):
-        """no_fee sets no API params; search() handles it with two parallel calls."""
-        params = client._build_search_params(library_type="no_fee")
-        assert "componentLibraryType" not in params
-        assert "preferredComponentFlag" not in params
-
-    def test_build_search_params_sort_by_quantity(self, client):
-        """Sort by quantity (highest first)."""
-        params = client._build_search_params(sort_by="quantity")
-        assert params["sortMode"] == "STOCK_SORT"
-        assert params["sortASC"] == "DESC"
-
-    def test_build_search_params_sort_by_price(self, client):
-        """Sort by price (cheapest first)."""
-        params = client._build_search_params(sort_by="price")
-        assert params["sortMode"] == "PRICE_SORT"
-        assert params["sortASC"] == "ASC"
-
-    def test_build_search_params_sort_default(self, client):
-        """No sorting params when sort_by is None (default relevance)."""
-        params = client._build_search_params(query="ESP32")
-        assert "sortMode" not in params
-        assert "sortASC" not in params
-
-    def test_build_search_params_sort_invalid(self, client):
-        """Invalid sort_by value is ignored."""
-        params = client._build_search_params(sort_by="invalid")
-        assert "sortMode" not in params
-        assert "sortASC" not in params
-
-    def test_build_search_params_packages_multi(self, client):
-        """Multiple packages use componentSpecificationList (OR filter)."""
-        params = client._build_search_params(packages=["0402", "0603", "0805"])
-        assert params["componentSpecificationList"] == ["0402", "0603", "0805"]
-        assert "componentSpecification" not in params
-
-    def test_build_search_params_packages_empty(self, client):
-        """Empty packages list is ignored."""
-        params = client._build_search_params(packages=[])
-        assert "componentSpecificationList" not in params
-        assert "componentSpecification" not in params
-
-    def test_build_search_params_package_single_over_multi(self, client):
-        """Multi-select packages takes precedence over single package."""
-        params = client._build_search_params(package="0402", packages=["0603", "0805"])
-        assert params["componentSpecificationList"] == ["0603", "0805"]
-        assert "componentSpecification" not in params
-
-    def test_build_search_params_manufacturers_multi(self, client):
-        """Multiple manufacturers use componentBrandList (OR filter) with alias resolution."""
-        params = client._build_search_params(manufacturers=["TI", "STM"])
-        # Aliases are resolved: TI -> Texas Instruments, STM -> STMicroelectronics
-        assert params["componentBrandList"] == ["Texas Instruments", "STMicroelectronics"]
-        assert "componentBrand" not in params
-
-    def test_build_search_params_manufacturers_empty(self, client):
-        """Empty manufacturers list is ignored."""
-        params = client._build_search_params(manufacturers=[])
-        assert "componentBrandList" not in params
-        assert "componentBrand" not in params
-
-    def test_build_search_params_manufacturer_single_over_multi(self, client):
-        """Multi-select manufacturers takes precedence over single manufacturer."""
-        params = client._build_search_params(manufacturer="TI", manufacturers=["STM", "NXP"])
-        # Aliases resolved: STM -> STMicroelectronics, NXP -> NXP Semicon
-        assert params["componentBrandList"] == ["STMicroelectronics", "NXP Semicon"]
-        assert "componentBrand" not in params
+    @pytest.mark.parametrize("kwargs,expected", [
+        # Keyword and paging defaults
+        ({"query": "ESP32"}, {"keyword": "ESP32", "currentPage": 1, "pageSize": 20}),
+        # Category / subcategory resolve names from the category cache
+        ({"category_id": 1}, {"firstSortId": 1, "firstSortName": "Resistors", "searchType": 3}),
+        ({"subcategory_id": 2980}, {
+            "firstSortId": 1,
+            "firstSortName": "Resistors",
+            "secondSortId": 2980,
+            "secondSortName": "Chip Resistor - Surface Mount",
+            "searchType": 3,
+        }),
+        ({"min_stock": 1000}, {"startStockNumber": 1000}),
+        # Library type
+        ({"library_type": "basic"}, {"componentLibraryType": "base"}),
+        ({"library_type": "extended"}, {"componentLibraryType": "expand"}),
+        ({"library_type": "preferred"}, {"preferredComponentFlag": True}),
+        # Sorting: quantity highest first, price cheapest first
+        ({"sort_by": "quantity"}, {"sortMode": "STOCK_SORT", "sortASC": "DESC"}),
+        ({"sort_by": "price"}, {"sortMode": "PRICE_SORT", "sortASC": "ASC"}),
+        # Multiple packages use componentSpecificationList (OR filter);
+        # multi-select takes precedence over a single package
+        ({"packages": ["0402", "0603", "0805"]}, {"componentSpecificationList": ["0402", "0603", "0805"]}),
+        ({"package": "0402", "packages": ["0603", "0805"]}, {"componentSpecificationList": ["0603", "0805"]}),
+        # Multiple manufacturers use componentBrandList (OR filter) with alias
+        # resolution (TI -> Texas Instruments, STM -> STMicroelectronics, NXP -> NXP Semicon)
+        ({"manufacturers": ["TI", "STM"]}, {"componentBrandList": ["Texas Instruments", "STMicroelectronics"]}),
+        ({"manufacturer": "TI", "manufacturers": ["STM", "NXP"]}, {"componentBrandList": ["STMicroelectronics", "NXP Semicon"]}),
+    ], ids=[
+        "keyword", "category", "subcategory", "stock",
+        "library_basic", "library_extended", "library_preferred",
+        "sort_quantity", "sort_price",
+        "packages_multi", "packages_over_single",
+        "manufacturers_multi", "manufacturers_over_single",
+    ])
+    def test_build_search_params(self, client, kwargs, expected):
+        params = client._build_search_params(**kwargs)
+        for key, value in expected.items():
+            assert params[key] == value, f"{key}: {params.get(key)!r} != {value!r}"
+
+    @pytest.mark.parametrize("kwargs,absent", [
+        # no_fee sets no API params; search() handles it with two parallel calls
+        ({"library_type": "no_fee"}, ["componentLibraryType", "preferredComponentFlag"]),
+        # No sorting params for default relevance or an invalid sort_by
+        ({"query": "ESP32"}, ["sortMode", "sortASC"]),
+        ({"sort_by": "invalid"}, ["sortMode", "sortASC"]),
+        # Empty lists are ignored; multi-select never also sets the single field
+        ({"packages": []}, ["componentSpecificationList", "componentSpecification"]),
+        ({"packages": ["0402", "0603"]}, ["componentSpecification"]),
+        ({"package": "0402", "packages": ["0603", "0805"]}, ["componentSpecification"]),
+        ({"manufacturers": []}, ["componentBrandList", "componentBrand"]),
+        ({"manufacturers": ["TI", "STM"]}, ["componentBrand"]),
+        ({"manufacturer": "TI", "manufacturers": ["STM", "NXP"]}, ["componentBrand"]),
+    ], ids=[
+        "library_no_fee", "sort_default", "sort_invalid",
+        "packages_empty", "packages_multi", "packages_over_single",
+        "manufacturers_empty", "manufacturers_multi", "manufacturers_over_single",
+    ])
+    def test_build_search_params_absent(self, client, kwargs, absent):
+        params = client._build_search_params(**kwargs)
+        for key in absent:
+            assert key not in params
 
     def test_manufacturer_alias_resolution(self, client):
         """Manufacturer aliases are resolved to full names."""
@@ -161,198 +153,58 @@ class TestClient:
         params = client._build_search_params(manufacturer="Unknown Corp")
         assert params["componentBrand"] == "Unknown Corp"
 
-    def test_transform_part_slim(self, client):
-        # Note: API returns firstSortName as subcategory, secondSortName as category
-        item = {
-            "componentCode": "C82899",
-            "componentModelEn": "ESP32-WROOM-32-N4",
-            "componentBrandEn": "Espressif Systems",
-            "componentSpecificationEn": "SMD,25.5x18mm",
-            "stockCount": 11117,
-            "componentLibraryType": "expand",
-            "preferredComponentFlag": False,
-            "firstSortName": "IoT Modules",  # subcategory
-            "secondSortName": "WiFi Modules",  # category
-            "componentPrices": [
-                {"startNumber": 1, "endNumber": 9, "productPrice": 4.2016},
-                {"startNumber": 10, "endNumber": 29, "productPrice": 3.7052},
-            ],
-            "attributes": [
-                {"attribute_name_en": "Voltage", "attribute_value_name": "3.3V"},
-                {"attribute_name_en": "Frequency", "attribute_value_name": "2.4GHz"},
-            ],
-        }
-        result = client._transform_part(item, slim=True)
-        assert result["lcsc"] == "C82899"
-        assert result["model"] == "ESP32-WROOM-32-N4"
-        assert result["manufacturer"] == "Espressif Systems"
-        assert result["stock"] == 11117
-        assert result["library_type"] == "extended"
-        assert result["price"] == 4.2016
-        assert result["price_10"] == 3.7052  # Volume pricing
-        assert result["category"] == "WiFi Modules"
-        assert result["subcategory"] == "IoT Modules"  # Now included in slim
-        assert result["specs"] == {"Voltage": "3.3V", "Frequency": "2.4GHz"}
-        assert "datasheet" not in result
-        assert "attributes" not in result  # Full list not in slim
+    # Golden input/expected pairs. Note: API returns firstSortName as
+    # subcategory and secondSortName as category.
+    @pytest.mark.parametrize("fixture,slim", [
+        ("esp32_slim.json", True),  # extended part; specs but no datasheet/attributes
+        ("esp32_full.json", False),  # preferred part; full price tiers and attributes
+    ])
+    def test_transform_part(self, client, fixture, slim):
+        data = load_json_fixture(fixture)
+        assert client._transform_part(data["input"], slim=slim) == data["expected"]
 
     def test_transform_part_slim_single_price_tier(self, client):
         """Parts with only one price tier should have price_10=None."""
-        item = {
-            "componentCode": "C12345",
-            "componentModelEn": "TEST",
-            "componentBrandEn": "Test",
-            "componentSpecificationEn": "0402",
-            "stockCount": 100,
-            "componentLibraryType": "base",
-            "preferredComponentFlag": False,
-            "firstSortName": "Test Sub",
-            "secondSortName": "Test Cat",
-            "componentPrices": [{"startNumber": 1, "endNumber": 9, "productPrice": 0.01}],
-        }
-        result = client._transform_part(item, slim=True)
+        result = client._transform_part(_MINIMAL_ITEM, slim=True)
         assert result["price_10"] is None  # Only one price tier
 
     def test_transform_part_no_prices(self, client):
         """Parts with no price tiers should have price=None and price_10=None."""
-        item = {
-            "componentCode": "C12345",
-            "componentModelEn": "TEST",
-            "componentBrandEn": "Test",
-            "componentSpecificationEn": "0402",
-            "stockCount": 100,
-            "componentLibraryType": "base",
-            "preferredComponentFlag": False,
-            "firstSortName": "Test Sub",
-            "secondSortName": "Test Cat",
-            "componentPrices": [],  # Empty price list
-        }
+        item = {**_MINIMAL_ITEM, "componentPrices": []}  # Empty price list
         result = client._transform_part(item, slim=True)
         assert result["price"] is None
         assert result["price_10"] is None
 
     def test_transform_part_no_attributes(self, client):
         """Parts with no attributes should have specs as empty dict."""
-        item = {
-            "componentCode": "C12345",
-            "componentModelEn": "TEST",
-            "componentBrandEn": "Test",
-            "componentSpecificationEn": "0402",
-            "stockCount": 100,
-            "componentLibraryType": "base",
-            "preferredComponentFlag": False,
-            "firstSortName": "Test Sub",
-            "secondSortName": "Test Cat",
-            "componentPrices": [{"startNumber": 1, "endNumber": 9, "productPrice": 0.01}],
-            "attributes": [],  # Empty attributes
-        }
+        item = {**_MINIMAL_ITEM, "attributes": []}  # Empty attributes
         result = client._transform_part(item, slim=True)
         assert result["specs"] == {}  # Should be empty dict, not missing
 
     def test_transform_part_missing_attributes_field(self, client):
         """Parts without attributes field should have specs as empty dict."""
-        item = {
-            "componentCode": "C12345",
-            "componentModelEn": "TEST",
-            "componentBrandEn": "Test",
-            "componentSpecificationEn": "0402",
-            "stockCount": 100,
-            "componentLibraryType": "base",
-            "preferredComponentFlag": False,
-            "firstSortName": "Test Sub",
-            "secondSortName": "Test Cat",
-            "componentPrices": [{"startNumber": 1, "endNumber": 9, "productPrice": 0.01}],
-            # No "attributes" field at all
-        }
-        result = client._transform_part(item, slim=True)
+        assert "attributes" not in _MINIMAL_ITEM  # No "attributes" field at all
+        result = client._transform_part(_MINIMAL_ITEM, slim=True)
         assert result["specs"] == {}  # Should be empty dict, not missing
 
-    def test_transform_part_full(self, client):
-        # Note: API returns firstSortName as subcategory, secondSortName as category
-        item = {
-            "componentCode": "C82899",
-            "componentModelEn": "ESP32-WROOM-32-N4",
-            "componentBrandEn": "Espressif Systems",
-            "componentSpecificationEn": "SMD,25.5x18mm",
-            "stockCount": 11117,
-            "componentLibraryType": "base",
-            "preferredComponentFlag": True,
-            "firstSortName": "IoT Modules",  # subcategory
-            "secondSortName": "WiFi Modules",  # category
-            "describe": "WiFi module description",
-            "minPurchaseNum": 1,
-            "encapsulationNumber": 550,
-            "dataManualUrl": "https://example.com/datasheet.pdf",
-            "lcscGoodsUrl": "https://lcsc.com/product/C82899",
-            "componentPrices": [
-                {"startNumber": 1, "endNumber": 9, "productPrice": 4.2016},
-                {"startNumber": 10, "endNumber": 29, "productPrice": 3.7052},
-            ],
-            "attributes": [
-                {"attribute_name_en": "Voltage", "attribute_value_name": "3.3V"},
-            ],
-        }
-        result = client._transform_part(item, slim=False)
-        assert result["lcsc"] == "C82899"
-        assert result["library_type"] == "preferred"
-        assert result["price"] == 4.2016
-        assert result["price_10"] == 3.7052
-        assert result["category"] == "WiFi Modules"
-        assert result["subcategory"] == "IoT Modules"
-        assert result["specs"] == {"Voltage": "3.3V"}  # Also in full mode
-        assert result["datasheet"] == "https://example.com/datasheet.pdf"
-        assert len(result["prices"]) == 2
-        assert result["prices"][0]["qty"] == "1+"
-        assert len(result["attributes"]) == 1
-        assert result["attributes"][0]["name"] == "Voltage"
-
-    # Tests for abbreviation matching
-
-    def test_match_category_abbreviation_led(self, client):
-        """LED abbreviation should match Optoelectronics category."""
-        assert client.match_category_by_name("led") == 16
-        assert client.match_category_by_name("LED") == 16
-        assert client.match_category_by_name("Led") == 16
-
-    def test_match_category_abbreviation_led_plural(self, client):
-        """LEDs (plural) should also match Optoelectronics."""
-        assert client.match_category_by_name("leds") == 16
-        assert client.match_category_by_name("LEDs") == 16
-
-    def test_match_category_abbreviation_esd(self, client):
-        """ESD abbreviation should match Circuit Protection category."""
-        assert client.match_category_by_name("esd") == 11
-        assert client.match_category_by_name("ESD") == 11
-
-    def test_match_category_abbreviation_adc(self, client):
-        """ADC abbreviation should match Data Acquisition category."""
-        assert client.match_category_by_name("adc") == 29
-        assert client.match_category_by_name("ADC") == 29
-        assert client.match_category_by_name("adcs") == 29
-
-    def test_match_category_abbreviation_transistors(self, client):
-        """BJT and FET abbreviations should match Transistors category."""
-        assert client.match_category_by_name("bjt") == 5
-        assert client.match_category_by_name("BJT") == 5
-        assert client.match_category_by_name("bjts") == 5
-        assert client.match_category_by_name("fet") == 5
-        assert client.match_category_by_name("FET") == 5
-        assert client.match_category_by_name("fets") == 5
-
-    def test_match_category_by_name_exact(self, client):
-        """Exact category name match."""
-        assert client.match_category_by_name("resistors") == 1
-        assert client.match_category_by_name("Resistors") == 1
-
-    def test_match_category_by_name_singular(self, client):
-        """Singular form should match plural category."""
-        assert client.match_category_by_name("resistor") == 1
-
-    def test_match_category_by_name_no_match(self, client):
-        """Non-matching query should return None."""
-        assert client.match_category_by_name("xyz123") is None
-        assert client.match_category_by_name("") is None
-        assert client.match_category_by_name(None) is None
+    # Tests for category name / abbreviation matching
+
+    @pytest.mark.parametrize("query,expected_id", [
+        # LED abbreviation (and plural) -> Optoelectronics
+        ("led", 16), ("LED", 16), ("Led", 16), ("leds", 16), ("LEDs", 16),
+        # ESD -> Circuit Protection
+        ("esd", 11), ("ESD", 11),
+        # ADC -> Data Acquisition
+        ("adc", 29), ("ADC", 29), ("adcs", 29),
+        # BJT / FET -> Transistors
+        ("bjt", 5), ("BJT", 5), ("bjts", 5), ("fet", 5), ("FET", 5), ("fets", 5),
+        # Exact category name, and singular form of a plural name
+        ("resistors", 1), ("Resistors", 1), ("resistor", 1),
+        # No match
+        ("xyz123", None), ("", None), (None, None),
+    ])
+    def test_match_category_by_name(self, client, query, expected_id):
+        assert client.match_category_by_name(query) == expected_id
 
     def test_resolve_abbreviation_requires_categories(self, client):
         """Abbreviation resolution requires categories to be loaded."""
@@ -393,31 +245,82 @@ class TestClient:
         assert await client.get_part("   ") is None
 
 
+# Live searches the integration tests assert on, keyed by name
+_LIVE_SEARCHES = {
+    "keyword": {"query": "ESP32", "limit": 5},
+    "pagination": {"query": "resistor", "limit": 10},
+    "specs": {"query": "10uF capacitor", "limit": 5},
+    "category": {"category_id": 1, "min_stock": 0, "limit": 5},
+    "stock_filter": {"category_id": 1, "min_stock": 10000, "limit": 5},
+    "no_fee": {"query": "resistor", "library_type": "no_fee", "limit": 10},
+    "sort_quantity": {"query": "ESP32", "sort_by": "quantity", "limit": 10},
+    "sort_price": {"query": "ESP32", "sort_by": "price", "limit": 10},
+    # Capacitors (category 2) with multi-select packages
+    "packages_multi": {"category_id": 2, "packages": ["0402", "0603", "0805"], "limit": 20},
+    "manufacturers_multi": {
+        "query": "microcontroller",
+        "manufacturers": ["STMicroelectronics", "Microchip Tech"],
+        "limit": 20,
+    },
+    # Attribute value as keyword, combined with category, packages and stock
+    "combined_filters": {
+        "query": "100nF",
+        "category_id": 2,
+        "packages": ["0402", "0603"],
+        "min_stock": 1000,
+        "limit": 10,
+    },
+    "sorted_multi_filters": {
+        "category_id": 2,
+        "packages": ["0402", "0603"],
+        "sort_by": "price",
+        "min_stock": 100,
+        "limit": 10,
+    },
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def search_results(live_client):
+    """Run all live searches concurrently, once per module.
+
+    The client's JLCPCB semaphore and wafer rate limiter still pace the
+    requests; this only overlaps their round-trips. Failures are kept per
+    search, so one transient error fails only the test that reads it (see
+    _live_result) instead of erroring the whole fixture.
+    """
+    results = await asyncio.gather(
+        *(live_client.search(**kwargs) for kwargs in _LIVE_SEARCHES.values()),
+        return_exceptions=True,
+    )
+    return dict(zip(_LIVE_SEARCHES, results))
+
+
+def _live_result(search_results, name):
+    """Return one live search result, re-raising that search's own error."""
+    result = search_results[name]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 @pytest.mark.integration
-@pytest.mark.asyncio
-class TestClientIntegration:
-    """Integration tests that hit the real JLCPCB API.
+class TestClientSearchIntegration:
+    """Integration checks on the live searches prefetched by search_results.
 
-    Uses a class-scoped client so all tests share one wafer session,
-    accumulating cookies and respecting rate limits across tests.
+    Plain (sync) tests: the network work happens once in the module fixture.
     """
 
-    @pytest.fixture(scope="class")
-    async def client(self):
-        client = JLCPCBClient()
-        yield client
-        await client.close()
-
-    async def test_search_keyword(self, client):
+    def test_search_keyword(self, search_results):
         """Test keyword search."""
-        result = await client.search(query="ESP32", limit=5)
+        result = _live_result(search_results, "keyword")
         assert "results" in result
         assert len(result["results"]) > 0
         assert result["results"][0]["lcsc"].startswith("C")
 
-    async def test_search_pagination_fields(self, client):
+    def test_search_pagination_fields(self, search_results):
         """Test pagination fields in search results."""
-        result = await client.search(query="resistor", limit=10)
+        result = _live_result(search_results, "pagination")
         # Check all pagination fields exist
         assert "page" in result
         assert "per_page" in result
@@ -430,29 +333,29 @@ class TestClientIntegration:
         assert result["per_page"] == 10
         assert result["page"] == 1
 
-    async def test_search_results_have_specs(self, client):
+    def test_search_results_have_specs(self, search_results):
         """Test that search results include specs field."""
-        result = await client.search(query="10uF capacitor", limit=5)
+        result = _live_result(search_results, "specs")
         assert len(result["results"]) > 0
         # All results should have specs (even if empty dict)
         for part in result["results"]:
             assert "specs" in part, f"Part {part['lcsc']} missing specs"
             assert isinstance(part["specs"], dict)
 
-    async def test_search_category(self, client):
+    def test_search_category(self, search_results):
         """Test category filtering."""
-        result = await client.search(category_id=1, min_stock=0, limit=5)
+        result = _live_result(search_results, "category")
         assert result["total"] > 100000  # Resistors should have >100K parts (when min_stock=0)
         assert all(r["category"] == "Resistors" for r in result["results"])
 
-    async def test_search_stock_filter(self, client):
+    def test_search_stock_filter(self, search_results):
         """Test stock filtering."""
-        result = await client.search(category_id=1, min_stock=10000, limit=5)
+        result = _live_result(search_results, "stock_filter")
         assert all(r["stock"] >= 10000 for r in result["results"])
 
-    async def test_search_library_type_no_fee(self, client):
+    def test_search_library_type_no_fee(self, search_results):
         """Test no_fee library type returns only basic/preferred parts."""
-        result = await client.search(query="resistor", library_type="no_fee", limit=10)
+        result = _live_result(search_results, "no_fee")
         assert len(result["results"]) > 0
         # no_fee should only return basic or preferred parts (no extended)
         for part in result["results"]:
@@ -460,62 +363,26 @@ class TestClientIntegration:
                 f"Part {part['lcsc']} has library_type={part['library_type']}, preferred={part['preferred']}"
             )
 
-    async def test_get_part(self, client):
-        """Test getting part details."""
-        result = await client.get_part("C82899")
-        assert result is not None
-        assert result["lcsc"] == "C82899"
-        assert "prices" in result
-        assert "datasheet" in result
-
-    async def test_fetch_categories(self, client):
-        """Test fetching live category data from API."""
-        categories = await client.fetch_categories()
-
-        # Minimum thresholds (90% of expected ~51 categories, ~756 subcategories)
-        assert len(categories) >= 46, (
-            f"Expected at least 46 categories, got {len(categories)}. "
-            "JLCPCB API may have changed or is returning incomplete data."
-        )
-
-        # Check structure of a category
-        cat = categories[0]
-        assert "id" in cat
-        assert "name" in cat
-        assert "count" in cat
-        assert "subcategories" in cat
-
-        # Should have subcategories - minimum threshold (90% of expected)
-        total_subs = sum(len(c["subcategories"]) for c in categories)
-        assert total_subs >= 680, (
-            f"Expected at least 680 subcategories, got {total_subs}. "
-            "JLCPCB API may have changed or is returning incomplete data."
-        )
-
-    async def test_search_sort_by_quantity(self, client):
+    def test_search_sort_by_quantity(self, search_results):
         """Test sorting by quantity (highest first)."""
-        result = await client.search(query="ESP32", sort_by="quantity", limit=10)
+        result = _live_result(search_results, "sort_quantity")
         stocks = [r["stock"] for r in result["results"] if r["stock"] is not None]
         # Check descending order (each value >= next)
         for i in range(len(stocks) - 1):
             assert stocks[i] >= stocks[i + 1], "Results should be sorted by quantity descending"
 
-    async def test_search_sort_by_price(self, client):
+    def test_search_sort_by_price(self, search_results):
         """Test sorting by price (cheapest first)."""
-        result = await client.search(query="ESP32", sort_by="price", limit=10)
+        result = _live_result(search_results, "sort_price")
         prices = [r["price"] for r in result["results"] if r["price"] is not None]
         # Check ascending order (each value <= next)
         for i in range(len(prices) - 1):
             assert prices[i] <= prices[i + 1], "Results should be sorted by price ascending"
 
-    async def test_search_packages_multi(self, client):
+    def test_search_packages_multi(self, search_results):
         """Test multi-select package filter (OR logic)."""
         # Search capacitors with multiple package sizes
-        result = await client.search(
-            category_id=2,  # Capacitors
-            packages=["0402", "0603", "0805"],
-            limit=20,
-        )
+        result = _live_result(search_results, "packages_multi")
         # Collect packages from results
         result_packages = {r["package"] for r in result["results"]}
         # Should include at least some of the requested packages
@@ -523,13 +390,9 @@ class TestClientIntegration:
             f"Expected some of ['0402', '0603', '0805'], got {result_packages}"
         )
 
-    async def test_search_manufacturers_multi(self, client):
+    def test_search_manufacturers_multi(self, search_results):
         """Test multi-select manufacturer filter (OR logic)."""
-        result = await client.search(
-            query="microcontroller",
-            manufacturers=["STMicroelectronics", "Microchip Tech"],
-            limit=20,
-        )
+        result = _live_result(search_results, "manufacturers_multi")
         # Collect manufacturers from results
         result_mfrs = {r["manufacturer"] for r in result["results"]}
         # Should include at least one of the requested manufacturers
@@ -537,35 +400,69 @@ class TestClientIntegration:
             f"Expected some of ['STMicroelectronics', 'Microchip Tech'], got {result_mfrs}"
         )
 
-    async def test_search_combined_filters(self, client):
+    def test_search_combined_filters(self, search_results):
         """Test combining keyword, category, multi-package, and stock filters."""
-        result = await client.search(
-            query="100nF",  # Attribute value as keyword
-            category_id=2,  # Capacitors
-            packages=["0402", "0603"],
-            min_stock=1000,
-            limit=10,
-        )
+        result = _live_result(search_results, "combined_filters")
         assert len(result["results"]) > 0, "Should find 100nF capacitors"
         # Verify all results meet stock requirement
         for part in result["results"]:
             assert part["stock"] >= 1000, f"Part {part['lcsc']} has stock {part['stock']} < 1000"
 
-    async def test_search_sorted_with_multi_filters(self, client):
+    def test_search_sorted_with_multi_filters(self, search_results):
         """Test sorting combined with multi-select filters."""
-        result = await client.search(
-            category_id=2,  # Capacitors
-            packages=["0402", "0603"],
-            sort_by="price",
-            min_stock=100,
-            limit=10,
-        )
+        result = _live_result(search_results, "sorted_multi_filters")
         assert len(result["results"]) > 0, "Should find capacitors"
         # Verify price sorting (ascending)
         prices = [r["price"] for r in result["results"] if r["price"] is not None]
         for i in range(len(prices) - 1):
             assert prices[i] <= prices[i + 1], "Results should be sorted by price ascending"
 
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+class TestClientIntegration:
+    """Integration tests that hit the real JLCPCB API.
+
+    Uses the session-scoped live client (see conftest.py) so all tests share
+    one wafer session, accumulating cookies and respecting rate limits.
+    """
+
+    @pytest.fixture
+    def client(self, live_client):
+        return live_client
+
+    async def test_get_part(self, client):
+        """Test getting part details."""
+        result = await client.get_part("C82899")
+        assert result is not None
+        assert result["lcsc"] == "C82899"
+        assert "prices" in result
+        assert "datasheet" in result
+
+    async def test_fetch_categories(self, live_categories):
+        """Test fetching live category data from API."""
+        categories = live_categories
+
+        # Minimum thresholds (90% of expected ~51 categories, ~756 subcategories)
+        assert len(categories) >= 46, (
+            f"Expected at least 46 categories, got {len(categories)}. "
+            "JLCPCB API may have changed or is returning incomplete data."
+        )
+
+        # Check structure of a category
+        cat = categories[0]
+        assert "id" in cat
+        assert "name" in cat
+        assert "count" in cat
+        assert "subcategories" in cat
+
+        # Should have subcategories - minimum threshold (90% of expected)
+        total_subs = sum(len(c["subcategories"]) for c in categories)
+        assert total_subs >= 680, (
+            f"Expected at least 680 subcategories, got {total_subs}. "
+            "JLCPCB API may have changed or is returning incomplete data."
+        )
+
     async def test_get_part_invalid_format_returns_none(self, client):
         """Invalid LCSC codes should return None without API errors."""
         result = await client.get_part("INVALID")
@@ -577,12 +474,9 @@ class TestClientIntegration:
         assert result is not None
         assert result["lcsc"] == "C82899"  # normalized to uppercase
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives(self, client):
         """Test find_alternatives method on client."""
-        # Fetch categories first (required for subcategory lookup)
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         # Find alternatives for a common 10k resistor
         result = await client.find_alternatives("C25531", min_stock=100, limit=5)
 
@@ -609,12 +503,9 @@ class TestClientIntegration:
         assert "error" in result
         assert "not found" in result["error"].lower()
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives_same_package(self, client):
         """Test find_alternatives with same_package filter."""
-        # Fetch categories first
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         # Find alternatives for a common capacitor with same package
         result = await client.find_alternatives("C14663", min_stock=100, same_package=True, limit=5)
 
@@ -660,11 +551,9 @@ class TestClientIntegration:
         # Check cache contains the entry
         assert "C1525" in client._easyeda_cache
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives_with_easyeda_filter(self, client):
         """Test find_alternatives with has_easyeda_footprint filter."""
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         # Find alternatives with EasyEDA footprints only
         result = await client.find_alternatives(
             "C25531",  # Common 10k resistor
@@ -681,11 +570,9 @@ class TestClientIntegration:
             # When filtering for True, all should have footprints
             assert alt["has_easyeda_footprint"] is True
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives_with_library_type_filter(self, client):
         """Test find_alternatives with library_type filter."""
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         # Find basic library alternatives only (no assembly fee)
         result = await client.find_alternatives(
             "C1525",  # Basic capacitor
@@ -701,11 +588,9 @@ class TestClientIntegration:
         for alt in result["alternatives"]:
             assert alt["library_type"] == "basic"
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives_with_no_fee_filter(self, client):
         """Test find_alternatives with library_type='no_fee' (basic + preferred)."""
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         # Find no-fee alternatives (basic or preferred)
         result = await client.find_alternatives(
             "C1525",  # Basic capacitor
@@ -721,11 +606,9 @@ class TestClientIntegration:
         for alt in result["alternatives"]:
             assert alt["library_type"] in ("basic", "preferred") or alt.get("preferred")
 
+    @pytest.mark.usefixtures("live_categories")
     async def test_find_alternatives_includes_library_type_in_original(self, client):
         """Test find_alternatives includes library_type in original part info."""
-        categories = await client.fetch_categories()
-        client.set_categories(categories)
-
         result = await client.find_alternatives("C1525", limit=3)
 
         assert "error" not in result
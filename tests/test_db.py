@@ -1,5 +1,7 @@
 """Tests for the parametric database search."""
 
+from unittest.mock import patch
+
 import pytest
 
 from pcbparts_mcp.db import ComponentDatabase, get_db
@@ -530,6 +532,37 @@ class TestErrorMessagesWithSuggestions:
         similar = result["similar_subcategories"]
         assert len(similar) > 0 or similar == []  # May be empty if no matches
 
+    def test_similar_subcategories_match_whole_words(self):
+        """Suggestions match whole words (plural-insensitive), not substrings."""
+        from pcbparts_mcp.subcategory_aliases import find_similar_subcategories
+
+        name_to_id = {"smart cards": 1, "usb connectors": 2, "translators, level shifters": 3}
+        info = {
+            1: {"name": "Smart Cards", "category_name": "Other"},
+            2: {"name": "USB Connectors", "category_name": "Connectors"},
+            3: {"name": "Translators, Level Shifters", "category_name": "Interface"},
+        }
+
+        assert find_similar_subcategories("art", name_to_id, info) == []
+        ids = [m["id"] for m in find_similar_subcategories("usb connector", name_to_id, info)]
+        assert ids == [2]
+        assert find_similar_subcategories("level shifter", name_to_id, info)[0]["id"] == 3
+
+    def test_similar_subcategories_reuses_index(self):
+        """The word index is built once per name map, and names fall back to lowercase."""
+        from pcbparts_mcp import subcategory_aliases
+        from pcbparts_mcp.subcategory_aliases import find_similar_subcategories
+
+        name_to_id = {"usb connectors": 2}
+        with patch.object(
+            subcategory_aliases, "build_subcategory_word_index",
+            wraps=subcategory_aliases.build_subcategory_word_index,
+        ) as build:
+            first = find_similar_subcategories("usb", name_to_id, {})
+            find_similar_subcategories("connector", name_to_id, {})
+        assert build.call_count == 1
+        assert first == [{"id": 2, "name": "usb connectors", "category": ""}]
+
     def test_error_response_has_consistent_structure(self):
         """Error responses should have consistent structure."""
         db = get_db()
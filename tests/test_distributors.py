@@ -3,7 +3,9 @@
 import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import unquote
 
+import orjson
 import pytest
 
 from pcbparts_mcp.mouser import MouserClient, MouserAPIError, _parse_stock, _parse_price, _normalize_part
@@ -30,6 +32,14 @@ class TestTTLCache:
         time.sleep(0.02)
         assert cache.get("key") is None
 
+    def test_per_entry_ttl(self):
+        cache = TTLCache(ttl=3600)
+        cache.set("short", "value", ttl=0.01)
+        cache.set("long", "value")
+        time.sleep(0.02)
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+
     def test_max_size_lru_eviction(self):
         cache = TTLCache(ttl=3600, max_size=3)
         cache.set("a", 1)
@@ -339,6 +349,15 @@ class TestDigiKeyNormalizeProduct:
         assert result["price_breaks"] == []
         assert result["parameters"] == {}
 
+    def test_null_quantities(self):
+        """Explicit nulls fall back to the same defaults as missing fields."""
+        result = _normalize_product({
+            "QuantityAvailable": None,
+            "ProductVariations": [{"MinimumOrderQuantity": None}],
+        })
+        assert result["stock"] == 0
+        assert result["min_qty"] == 1
+
 
 # --- Mouser client tests ---
 
@@ -474,7 +493,7 @@ class TestDigiKeyClient:
         token_resp = self._mock_token_response()
         detail_resp = MagicMock()
         detail_resp.status_code = 200
-        detail_resp.json.return_value = {
+        detail_resp.content = orjson.dumps({
             "Product": {
                 "Description": {"ProductDescription": "Test"},
                 "Manufacturer": {"Name": "Test"},
@@ -486,7 +505,7 @@ class TestDigiKeyClient:
                 "ProductVariations": [],
                 "Parameters": [],
             },
-        }
+        })
         detail_resp.raise_for_status = MagicMock()
 
         async def mock_request(method, url, **kwargs):
@@ -497,11 +516,14 @@ class TestDigiKeyClient:
         async def mock_post(url, **kwargs):
             return token_resp
 
-        with patch.object(client._http, "post", side_effect=mock_post):
+        with patch.object(client._http, "post", side_effect=mock_post) as mock_token_post:
             with patch.object(client._http, "request", side_effect=mock_request):
                 await client.get_part("TEST123")
 
         assert client._access_token == "test-token-123"
+        assert mock_token_post.call_args.kwargs["content"] == (
+            b"client_id=test-id&client_secret=test-secret&grant_type=client_credentials"
+        )
 
     @pytest.mark.asyncio
     async def test_token_reuse(self, client):
@@ -512,7 +534,7 @@ class TestDigiKeyClient:
 
         detail_resp = MagicMock()
         detail_resp.status_code = 200
-        detail_resp.json.return_value = {
+        detail_resp.content = orjson.dumps({
             "Product": {
                 "Description": {"ProductDescription": "Test"},
                 "Manufacturer": {"Name": "Test"},
@@ -524,7 +546,7 @@ class TestDigiKeyClient:
                 "ProductVariations": [],
                 "Parameters": [],
             },
-        }
+        })
         detail_resp.raise_for_status = MagicMock()
 
         with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp):
@@ -540,7 +562,7 @@ class TestDigiKeyClient:
 
         detail_resp = MagicMock()
         detail_resp.status_code = 200
-        detail_resp.json.return_value = {
+        detail_resp.content = orjson.dumps({
             "Product": {
                 "Description": {"ProductDescription": "Dual Op Amp"},
                 "Manufacturer": {"Name": "TI"},
@@ -556,7 +578,7 @@ class TestDigiKeyClient:
                     {"ParameterId": 1, "ParameterText": "Type", "ValueText": "General Purpose"},
                 ],
             },
-        }
+        })
         detail_resp.raise_for_status = MagicMock()
 
         with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp):
@@ -574,13 +596,191 @@ class TestDigiKeyClient:
 
         detail_resp = MagicMock()
         detail_resp.status_code = 200
-        detail_resp.json.return_value = {"Product": {}}
+        detail_resp.content = orjson.dumps({"Product": {}})
         detail_resp.raise_for_status = MagicMock()
 
-        with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp):
+        with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp) as mock_req:
             result = await client.get_part("NONEXISTENT")
+            # Misses are cached too (case-insensitively)
+            again = await client.get_part("nonexistent")
 
         assert "error" in result
+        assert again == result
+        assert mock_req.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_part_revalidates_with_etag(self, client):
+        """An expired entry is revalidated with If-None-Match; a 304 reuses the cached result."""
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        ok_resp = MagicMock()
+        ok_resp.status_code = 200
+        ok_resp.headers = {"ETag": '"abc123"'}
+        ok_resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": "LM358P"}})
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+
+        with patch.object(
+            client._http, "request", new_callable=AsyncMock, side_effect=[ok_resp, not_modified]
+        ) as mock_req:
+            first = await client.get_part("LM358P")
+            client._cache._data.clear()
+            # Age the ETag entry to a minute before it expires
+            ts, ttl, entry = client._etag_cache._data["digikey:LM358P"]
+            aged_ts = ts - ttl + 60
+            client._etag_cache._data["digikey:LM358P"] = (aged_ts, ttl, entry)
+            second = await client.get_part("LM358P")
+
+        assert mock_req.call_count == 2
+        assert mock_req.call_args.kwargs["headers"]["If-None-Match"] == '"abc123"'
+        assert second == first
+        # Revalidated result is back in the main cache
+        assert client._cache.get("digikey:LM358P") == first
+        # ...and the 304 restarted the ETag entry's TTL
+        assert client._etag_cache._data["digikey:LM358P"][0] > aged_ts
+        assert client._etag_cache.get("digikey:LM358P") == ('"abc123"', first)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_part_coalesced(self, client):
+        """Concurrent lookups of one part (any case) share a single request."""
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        async def mock_request(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {}
+            resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": "LM358P"}})
+            return resp
+
+        with patch.object(client._http, "request", side_effect=mock_request) as mock_req:
+            results = await asyncio.gather(
+                *(client.get_part(pn) for pn in ("LM358P", "lm358p", "LM358P", "Lm358P"))
+            )
+
+        assert mock_req.call_count == 1
+        assert all(r == results[0] for r in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self, client):
+        """Cancelling the caller that started a lookup leaves other waiters' result intact."""
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        async def mock_request(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {}
+            resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": "LM358P"}})
+            return resp
+
+        with patch.object(client._http, "request", side_effect=mock_request) as mock_req:
+            leader = asyncio.create_task(client.get_part("LM358P"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(client.get_part("LM358P"))
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            result = await follower
+
+        assert leader.cancelled()
+        assert mock_req.call_count == 1
+        assert result["results"][0]["mfr_part_number"] == "LM358P"
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_serves_stable_fields(self):
+        """Once stock/price expire and quota is gone, stable part details are still served."""
+        client = DigiKeyClient(client_id="test-id", client_secret="test-secret", quota=DailyQuota("DigiKey", 1))
+        client._get_http()
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        detail_resp = MagicMock()
+        detail_resp.status_code = 200
+        detail_resp.headers = {}
+        detail_resp.content = orjson.dumps({
+            "Product": {
+                "ManufacturerProductNumber": "LM358P",
+                "DatasheetUrl": "https://example.com/lm358.pdf",
+                "QuantityAvailable": 15234,
+                "UnitPrice": 0.29,
+            },
+        })
+
+        with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp) as mock_req:
+            await client.get_part("LM358P")
+            client._cache._data.clear()
+            result = await client.get_part("LM358P")
+
+        assert mock_req.call_count == 1
+        part = result["results"][0]
+        assert part["mfr_part_number"] == "LM358P"
+        assert part["datasheet_url"] == "https://example.com/lm358.pdf"
+        assert "stock" not in part and "price" not in part
+        assert "quota" in result["note"]
+
+    @pytest.mark.asyncio
+    async def test_get_part_any_falls_back_to_variants(self, client):
+        """A miss on the original fans out to the remaining variants; first hit in order wins."""
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+        found = {"MCP73831T-2ACI/OT", "MCP73831-2ACI/OT-X"}
+
+        async def mock_request(method, url, **kwargs):
+            pn = unquote(url.split("/")[-2])
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": pn} if pn in found else {}})
+            return resp
+
+        variants = ["MCP73831-2ACI/OT-TR", "MCP73831T-2ACI/OT", "MCP73831-2ACI/OT-X"]
+        with patch.object(client._http, "request", side_effect=mock_request) as mock_req:
+            result = await client.get_part_any(variants)
+
+        assert mock_req.call_count == 3
+        assert result["results"][0]["mfr_part_number"] == "MCP73831T-2ACI/OT"
+        assert result["mpn_normalized"]["matched_query"] == "MCP73831T-2ACI/OT"
+
+    @pytest.mark.asyncio
+    async def test_get_part_any_original_error_tries_variants(self, client):
+        """An HTTP error on the original still falls back to the variants; it's raised only if all miss."""
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        async def mock_request(method, url, **kwargs):
+            pn = unquote(url.split("/")[-2])
+            resp = MagicMock()
+            resp.status_code = 400 if pn.endswith("/BAD") else 200
+            resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": pn} if pn == "LM358" else {}})
+            return resp
+
+        with patch.object(client._http, "request", side_effect=mock_request):
+            result = await client.get_part_any(["LM358/BAD", "LM358"])
+            assert result["mpn_normalized"]["matched_query"] == "LM358"
+
+            with pytest.raises(ValueError, match="HTTP 400"):
+                await client.get_part_any(["TL072/BAD", "TL072"])
+
+    @pytest.mark.asyncio
+    async def test_get_part_any_original_hit_single_request(self, client):
+        client._access_token = "token"
+        client._token_expires_at = time.time() + 500
+
+        detail_resp = MagicMock()
+        detail_resp.status_code = 200
+        detail_resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": "LM358P"}})
+
+        with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp) as mock_req:
+            result = await client.get_part_any(["LM358P", "LM358"])
+
+        assert mock_req.call_count == 1
+        assert "mpn_normalized" not in result
 
     @pytest.mark.asyncio
     async def test_cache_hit(self, client):
@@ -589,7 +789,7 @@ class TestDigiKeyClient:
 
         detail_resp = MagicMock()
         detail_resp.status_code = 200
-        detail_resp.json.return_value = {
+        detail_resp.content = orjson.dumps({
             "Product": {
                 "Description": {"ProductDescription": "Test"},
                 "Manufacturer": {"Name": "Test"},
@@ -601,7 +801,7 @@ class TestDigiKeyClient:
                 "ProductVariations": [],
                 "Parameters": [],
             },
-        }
+        })
         detail_resp.raise_for_status = MagicMock()
 
         with patch.object(client._http, "request", new_callable=AsyncMock, return_value=detail_resp) as mock_req:
@@ -622,7 +822,7 @@ class TestDigiKeyClient:
 
         resp_ok = MagicMock()
         resp_ok.status_code = 200
-        resp_ok.json.return_value = {
+        resp_ok.content = orjson.dumps({
             "Product": {
                 "Description": {"ProductDescription": "Test"},
                 "Manufacturer": {"Name": "Test"},
@@ -634,7 +834,7 @@ class TestDigiKeyClient:
                 "ProductVariations": [],
                 "Parameters": [],
             },
-        }
+        })
         resp_ok.raise_for_status = MagicMock()
 
         call_count = 0
@@ -659,6 +859,122 @@ class TestDigiKeyClient:
         # Token should be refreshed
         assert client._access_token == "test-token-123"
 
+    @pytest.mark.asyncio
+    async def test_background_token_refresh(self, client):
+        """The refresh task replaces a token nearing expiry; close() stops it."""
+        client._access_token = "old-token"
+        client._token_expires_at = time.time() + 60  # Inside the refresh margin
+
+        with patch("pcbparts_mcp.digikey.DIGIKEY_TOKEN_RETRY_DELAY", 0), patch.object(
+            client._http, "post", new_callable=AsyncMock, return_value=self._mock_token_response()
+        ) as mock_post:
+            client._refresh_task = asyncio.create_task(client._refresh_loop())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert client._access_token == "test-token-123"
+            await client.close()
+
+        assert mock_post.call_count == 1
+        assert client._refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_background_token_refresh_failure_keeps_token(self, client):
+        """A failed background refresh keeps the still-valid token in use."""
+        client._access_token = "old-token"
+        client._token_expires_at = time.time() + 60  # Inside the refresh margin
+
+        failed = MagicMock()
+        failed.status_code = 503
+        with patch("pcbparts_mcp.digikey.DIGIKEY_TOKEN_RETRY_DELAY", 0), patch.object(
+            client._http, "post", new_callable=AsyncMock, return_value=failed
+        ) as mock_post:
+            client._refresh_task = asyncio.create_task(client._refresh_loop())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert mock_post.call_count >= 1
+            # Requests keep using the old token instead of blocking on a refresh
+            assert client._access_token == "old-token"
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_dead_refresh_task_falls_back_to_expiry_check(self, client):
+        """If the refresh task has stopped, an expired token is refreshed before the request."""
+        client._access_token = "expired-token"
+        client._token_expires_at = time.time() - 10
+        client._refresh_task = asyncio.create_task(asyncio.sleep(0))
+        await client._refresh_task
+
+        detail_resp = MagicMock()
+        detail_resp.status_code = 200
+        detail_resp.headers = {}
+        detail_resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": "LM358P"}})
+
+        with patch.object(
+            client._http, "post", new_callable=AsyncMock, return_value=self._mock_token_response()
+        ) as mock_post, patch.object(
+            client._http, "request", new_callable=AsyncMock, return_value=detail_resp
+        ) as mock_req:
+            await client.get_part("LM358P")
+            # A fresh refresh task replaced the dead one
+            assert not client._refresh_task.done()
+            await client.close()
+
+        assert mock_post.call_count == 1
+        assert mock_req.call_count == 1  # No 401 round-trip
+        assert mock_req.call_args.kwargs["headers"]["Authorization"] == "Bearer test-token-123"
+
+    def test_auth_headers(self, client):
+        """Auth headers carry the current bearer token plus static locale headers."""
+        headers = client._auth_headers("tok-1")
+        assert headers["Authorization"] == "Bearer tok-1"
+        assert headers["X-DIGIKEY-Client-Id"] == "test-id"
+        assert headers["Content-Type"] == "application/json"
+        # Returned dicts are independent copies; a rotated token is picked up
+        headers["Authorization"] = "mutated"
+        assert client._auth_headers("tok-1")["Authorization"] == "Bearer tok-1"
+        assert client._auth_headers("tok-2")["Authorization"] == "Bearer tok-2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_refresh_token_once(self, client):
+        """Concurrent requests rejected with the same stale token share one refresh."""
+        client._access_token = "expired-token"
+        client._token_expires_at = time.time() + 500
+
+        resp_401 = MagicMock()
+        resp_401.status_code = 401
+
+        def ok_response(pn):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.content = orjson.dumps({"Product": {"ManufacturerProductNumber": pn}})
+            return resp
+
+        async def mock_request(method, url, headers=None, **kwargs):
+            pn = url.split("/")[-2]
+            await asyncio.sleep(0)  # Let every request go out with the stale token
+            if headers["Authorization"] == "Bearer expired-token":
+                # Stagger the 401s so some arrive after the first refresh finished
+                for _ in range(int(pn[2:]) * 3):
+                    await asyncio.sleep(0)
+                return resp_401
+            return ok_response(pn)
+
+        token_resp = self._mock_token_response()
+        post_count = 0
+
+        async def mock_post(url, **kwargs):
+            nonlocal post_count
+            post_count += 1
+            await asyncio.sleep(0)
+            return token_resp
+
+        with patch.object(client._http, "request", side_effect=mock_request):
+            with patch.object(client._http, "post", side_effect=mock_post):
+                results = await asyncio.gather(*(client.get_part(f"PN{i}") for i in range(5)))
+
+        assert post_count == 1
+        assert [r["results"][0]["mfr_part_number"] for r in results] == [f"PN{i}" for i in range(5)]
+
     @pytest.mark.asyncio
     async def test_oauth_error_response(self, client):
         """Token endpoint returning an OAuth error should raise ValueError."""
@@ -368,6 +368,20 @@ class TestConnectorSeriesExtraction:
         assert spec.pitch == pytest.approx(expected_pitch), f"Expected pitch {expected_pitch}mm"
         assert spec.pins == expected_pins, f"Expected pins {expected_pins}, got {spec.pins}"
 
+    @pytest.mark.parametrize("query,expected_remaining", [
+        # Every occurrence is removed, not just the first
+        ("qwiic to qwiic cable", "to cable"),
+        ("Qwiic to QWIIC cable", "to cable"),
+        # lower() changes the length of "İ"; the rest of the text must survive intact
+        ("İ qwiic cable", "İ cable"),
+    ])
+    def test_brand_alias_removed_from_remaining(self, query: str, expected_remaining: str):
+        """Brand names are stripped from the remaining query text."""
+        from pcbparts_mcp.smart_parser.connectors import extract_connector_series
+        spec, remaining = extract_connector_series(query)
+        assert spec is not None
+        assert remaining == expected_remaining
+
     def test_no_connector_series(self):
         """Test that non-connector queries return None."""
         from pcbparts_mcp.smart_parser.connectors import extract_connector_series
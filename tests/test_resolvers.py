@@ -1,7 +1,7 @@
 """Tests for search resolvers including MPN normalization."""
 
 import pytest
-from pcbparts_mcp.search.mpn import normalize_mpn, looks_like_mpn
+from pcbparts_mcp.search.mpn import MPN_TRAILING_SUFFIXES, normalize_mpn, looks_like_mpn
 
 
 class TestLooksLikeMpn:
@@ -55,6 +55,25 @@ class TestNormalizeMpn:
         assert "LM1117-3.3#PBF" in result
         assert "LM1117-3.3" in result
 
+    def test_trailing_suffixes_unambiguous(self):
+        """No suffix ends with another, so which one is stripped never depends on order."""
+        overlapping = [
+            (short, long)
+            for short in MPN_TRAILING_SUFFIXES
+            for long in MPN_TRAILING_SUFFIXES
+            if short != long and long.endswith(short)
+        ]
+        assert overlapping == []
+
+    @pytest.mark.parametrize("suffix", MPN_TRAILING_SUFFIXES)
+    def test_strip_each_suffix(self, suffix):
+        """Every listed suffix is stripped whole, in any case."""
+        assert normalize_mpn(f"TPS7A2033{suffix.lower()}")[1] == "TPS7A2033"
+
+    def test_strip_only_one_suffix(self):
+        """Only a single trailing suffix is stripped per query."""
+        assert normalize_mpn("AP2112K-3.3-TR-ND")[1] == "AP2112K-3.3-TR"
+
     def test_insert_t_for_tape_reel(self):
         """Microchip-style T insertion: MCP73831-2ACI -> MCP73831T-2ACI."""
         result = normalize_mpn("MCP73831-2ACI/MC")